@@ -9,18 +9,21 @@ Metadata parsing and database population for SNV Benchmarking Dashboard.
 Main components:
 - CSV metadata loading and validation
 - Data cleaning and enum mapping
-- Database record creation (with duplicate prevention)
+- Batched database record creation (with duplicate prevention)
 - Experiment linking and hap.py results integration
 """
 
 import os
+import enum
 import logging
 import pandas as pd
+from sqlalchemy import select, insert, String
 from database import get_db_session
 from models import *
 from config import METADATA_CSV_PATH
-from happy_parser import parse_happy_csv
-from utils import clean_value, safe_float
+from happy_parser import build_happy_records, insert_happy_records, summarize_happy_records
+from experiment_flat import refresh_experiment_flat
+from utils import clean_value, clean_value_series, safe_float_series
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -28,16 +31,34 @@ logger = logging.getLogger(__name__)
 # Keep original case for display columns (not converted to lowercase)
 DISPLAY_COLUMNS = ['name', 'description', 'platform_name', 'chemistry_name','caller_model','aligner_name','file_name']
 
+# QualityControl metric columns (numeric, may use thousands separators)
+QC_COLUMNS = ['mean_coverage', 'read_length', 'mean_read_length', 'mean_insert_size']
 
-# import all mapping functions from enum_mappings.py
-from enum_mappings import ENUM_MAPPINGS, map_enum, map_boolean  
+# Rows per executemany INSERT
+BATCH_SIZE = 1000
+
+# CSV rows read and committed together
+CHUNK_SIZE = 5000
+
+
+# import enum mappings from enum_mappings.py
+from enum_mappings import ENUM_MAPPINGS
+
+# Enum columns are read as categoricals: few distinct values, so cleaning and
+# enum mapping run once per distinct value instead of once per row
+CSV_DTYPES = {field_name: 'category' for field_name in ENUM_MAPPINGS}
 
 # ============================================================================
 # CSV LOADING AND VALIDATION
 # ============================================================================
 
-def load_csv_metadata(file_path=METADATA_CSV_PATH):
-    """Load and validate CSV metadata file"""
+def load_csv_metadata(file_path=METADATA_CSV_PATH, chunksize=CHUNK_SIZE):
+    """
+    Validate and open CSV metadata file.
+    
+    Returns:
+        Iterator of DataFrames with up to chunksize rows each, or None on error
+    """
     
     # File existence and access checks
     if not os.path.exists(file_path):
@@ -53,9 +74,9 @@ def load_csv_metadata(file_path=METADATA_CSV_PATH):
         return None
     
     try:
-        metadata_df = pd.read_csv(file_path)
-        logger.info(f"Successfully loaded {len(metadata_df)} rows from metadata CSV")
-        return metadata_df
+        metadata_chunks = pd.read_csv(file_path, chunksize=chunksize, dtype=CSV_DTYPES, thousands=',')
+        logger.info(f"Opened metadata CSV (reading {chunksize} rows at a time)")
+        return metadata_chunks
         
     except Exception as e:
         logger.error(f"Error loading metadata CSV: {e}")
@@ -72,98 +93,93 @@ def clean_dataframe_strings(df):
     prepares CSV data for database insertion by normalizing most string fields to lowercase,
     but keeps certain columns in their original case for better display in the UI (DISPLAY_COLUMNS).
     
+    Columns are replaced in place (no copy of the whole frame), so df itself
+    is modified.
+    
     Args:
         df (pandas.DataFrame): Raw CSV data loaded from metadata file
         
     Returns:
-        pandas.DataFrame: Cleaned dataframe with normalized strings
+        pandas.DataFrame: The same dataframe with normalized strings
 
     """
-    cleaned_df = df.copy()
-    
-    string_columns = cleaned_df.select_dtypes(include=['object']).columns
+    string_columns = df.select_dtypes(include=['object', 'category']).columns
     for col in string_columns:
-        if col not in DISPLAY_COLUMNS:
-            cleaned_df[col] = cleaned_df[col].apply(clean_value)
+        if col in DISPLAY_COLUMNS:
+            continue
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            # Clean each distinct value once, then re-factorize (cleaning can merge values)
+            df[col] = df[col].map(clean_value).astype('category')
+        else:
+            df[col] = clean_value_series(df[col])
     
-    return cleaned_df
-
-
-# ============================================================================
-# RECORD CREATION FUNCTIONS
-# ============================================================================
+    return df
 
-def add_record_if_not_exists(session, model_class, filter_fields, all_fields, record_name):
+def apply_enum_mappings(df):
     """
-    Generic function to create a database record only if it doesn't already exist.
-    Prevents duplicate records by checking for existing entries first.
+    Convert enum, boolean and QC metric columns in one pass per column.
+    
+    Enum columns (keys of ENUM_MAPPINGS) hold enum members afterwards (None if
+    unmapped), is_phased holds booleans and QC metrics hold floats, so the
+    field builders read values without per-cell conversion.
     
     Args:
-        session: Active SQLAlchemy database session for queries and commits
-        model_class: SQLAlchemy model class to create (e.g., SequencingTechnology, VariantCaller)
-        filter_fields (dict): Fields to check for existing records (e.g., {'name': 'ILLUMINA', 'platform': 'NovaSeq'})
-        all_fields (dict): Complete field set for creating new record (includes filter_fields + additional fields)
-        record_name (str): Human-readable description for logging (e.g., "sequencing tech", "variant caller")
+        df (pandas.DataFrame): Cleaned dataframe from clean_dataframe_strings
         
     Returns:
-        SQLAlchemy object: Either the existing record (if found) or newly created record
+        pandas.DataFrame: Dataframe with converted columns
     """
-    try:
-        existing = session.query(model_class).filter_by(**filter_fields).first()
-            
-        if not existing:
-            new_record = model_class(**all_fields)
-            session.add(new_record)
-            session.flush()
-            logger.debug(f"Added {record_name}")
-            return new_record
-        else:
-            logger.debug(f"Already exists {record_name}")
-            return existing
-                
-    except Exception as e:
-        logger.error(f"Error adding {record_name}: {e}")
-        session.rollback()
-        raise
+    for field_name, mapping in ENUM_MAPPINGS.items():
+        if field_name in df.columns:
+            mapped = df[field_name].map(mapping)
+            df[field_name] = mapped.astype(object).where(mapped.notna(), None)
     
-
-def add_sequencing_tech(session, row):
-    """Create SequencingTechnology record from CSV row"""
-    tech_enum = map_enum('technology', row['technology'])
-    target_enum = map_enum('target', row['target'])
-    type_enum = map_enum('platform_type', row['platform_type'])
+    if 'is_phased' in df.columns:
+        df['is_phased'] = df['is_phased'].astype(str).str.strip().str.lower().eq('true')
+    
+    for col in QC_COLUMNS:
+        if col in df.columns:
+            df[col] = safe_float_series(df[col])
     
+    return df
+
+
+# ============================================================================
+# RECORD FIELD BUILDERS
+# ============================================================================
+# Each builder returns (filter_fields, all_fields) for one CSV row, or None if
+# the row has no record of that type. filter_fields identify an existing record
+# (duplicate prevention), all_fields are used to create a new one.
+
+def sequencing_tech_fields(row):
+    """SequencingTechnology fields from CSV row"""
     filter_fields = {
-        'technology': tech_enum,
+        'technology': row['technology'],
         'platform_name': row['platform_name'],
     }
     all_fields = {
         **filter_fields,
-        'target': target_enum,
-        'platform_type': type_enum,
+        'target': row['target'],
+        'platform_type': row['platform_type'],
         'platform_version': row['platform_version']
     }
-    
-    return add_record_if_not_exists(session, SequencingTechnology, filter_fields, all_fields, "sequencing tech")
+    return filter_fields, all_fields
 
-def add_variant_caller(session, row):
-    """Create VariantCaller record from CSV row"""
-    name_enum = map_enum('caller_name', row['caller_name'])
-    type_enum = map_enum('caller_type', row['caller_type'])
-    
+def variant_caller_fields(row):
+    """VariantCaller fields from CSV row"""
     filter_fields = {
-        'name': name_enum,
+        'name': row['caller_name'],
         'version': row['caller_version']
     }
     all_fields = {
         **filter_fields,
-        'type': type_enum,
+        'type': row['caller_type'],
         'model': row.get('caller_model', None)
     }
-    return add_record_if_not_exists(session, VariantCaller, filter_fields, all_fields, "variant caller")
+    return filter_fields, all_fields
 
-def add_aligner(session, row):
-    """Create Aligner record from CSV row"""
+def aligner_fields(row):
+    """Aligner fields from CSV row"""
     # Skip if no aligner name provided
     if not row.get('aligner_name') or pd.isna(row.get('aligner_name')) or str(row.get('aligner_name')).strip() == '':
         return None
@@ -172,81 +188,169 @@ def add_aligner(session, row):
         'name': row['aligner_name'],
         'version': row['aligner_version']
     }
-    return add_record_if_not_exists(session, Aligner, filter_fields, filter_fields, "aligner")
+    return filter_fields, filter_fields
 
-def add_truth_set(session, row):
-    """Create TruthSet record from CSV row"""
-    name_enum = map_enum('truth_set_name', row['truth_set_name'])
-    reference_enum = map_enum('truth_set_reference', row['truth_set_reference'])
-    sample_enum = map_enum('truth_set_sample', row['truth_set_sample'])
-    
+def truth_set_fields(row):
+    """TruthSet fields from CSV row"""
     filter_fields = {
-        'name': name_enum,
+        'name': row['truth_set_name'],
         'version': row['truth_set_version'],
-        'sample': sample_enum,
-        'reference': reference_enum
+        'sample': row['truth_set_sample'],
+        'reference': row['truth_set_reference']
     }
-    return add_record_if_not_exists(session, TruthSet, filter_fields, filter_fields, "truth set")
+    return filter_fields, filter_fields
 
-def add_benchmark_tool(session, row):
-    """Create BenchmarkTool record from CSV row"""
-    tool_enum = map_enum('benchmark_tool_name', row['benchmark_tool_name'])
-    
+def benchmark_tool_fields(row):
+    """BenchmarkTool fields from CSV row"""
     filter_fields = {
-        'name': tool_enum,
+        'name': row['benchmark_tool_name'],
         'version': row['benchmark_tool_version']
     }
-    return add_record_if_not_exists(session, BenchmarkTool, filter_fields, filter_fields, "benchmark tool")
+    return filter_fields, filter_fields
 
-def add_variant(session, row):
-    """Create Variant record from CSV row"""
-    type_enum = map_enum('variant_type', row['variant_type'])
-    size_enum = map_enum('variant_size', row['variant_size'])
-    origin_enum = map_enum('variant_origin', row['variant_origin'])
-    phased_bool = map_boolean(row['is_phased'])
-    
+def variant_fields(row):
+    """Variant fields from CSV row"""
     filter_fields = {
-        'type': type_enum,
-        'size': size_enum,
-        'origin': origin_enum,
-        'is_phased': phased_bool
+        'type': row['variant_type'],
+        'size': row['variant_size'],
+        'origin': row['variant_origin'],
+        'is_phased': row['is_phased']
     }
-    return add_record_if_not_exists(session, Variant, filter_fields, filter_fields, "variant")
+    return filter_fields, filter_fields
 
-def add_chemistry(session, row):
-    """Create Chemistry record from CSV row"""
+def chemistry_fields(row):
+    """Chemistry fields from CSV row"""
     # Skip if no chemistry name provided
     if not row.get('chemistry_name') or pd.isna(row.get('chemistry_name')) or str(row.get('chemistry_name')).strip() == '':
         return None
         
-    tech_enum = map_enum('technology', row['technology'])
-    
     filter_fields = {
         'name': row['chemistry_name'],
-        'sequencing_technology': tech_enum,
+        'sequencing_technology': row['technology'],
         'sequencing_platform': row['platform_name'],
         'version': row.get('chemistry_version', None)
     }
-    return add_record_if_not_exists(session, Chemistry, filter_fields, filter_fields, "chemistry")
+    return filter_fields, filter_fields
 
-def add_quality_control(session, row):
-    """Create QualityControl record from CSV row"""
-    all_fields = {
-        'mean_coverage': safe_float(row.get('mean_coverage', None)),
-        'read_length': safe_float(row.get('read_length', None)),
-        'mean_read_length': safe_float(row.get('mean_read_length', None)),
-        'mean_insert_size': safe_float(row.get('mean_insert_size', None))
-    }
+def quality_control_fields(row):
+    """QualityControl fields from CSV row"""
+    # QC columns are already floats (apply_enum_mappings); only NaN -> None here
+    all_fields = {}
+    for col in QC_COLUMNS:
+        value = row.get(col, None)
+        all_fields[col] = None if value is None or pd.isna(value) else value
     
     # Skip if all QC fields are None/empty
     if all(value is None for value in all_fields.values()):
         return None
     
-    filter_fields = all_fields.copy()
-    return add_record_if_not_exists(session, QualityControl, filter_fields, all_fields, "quality control")
+    return all_fields, all_fields
+
+# Metadata records linked from each experiment:
+# key -> (model, field builder, human-readable name for logging, Experiment FK column)
+METADATA_RECORDS = {
+    'seq_tech': (SequencingTechnology, sequencing_tech_fields, "sequencing tech", 'sequencing_technology_id'),
+    'caller': (VariantCaller, variant_caller_fields, "variant caller", 'variant_caller_id'),
+    'aligner': (Aligner, aligner_fields, "aligner", 'aligner_id'),
+    'truth_set': (TruthSet, truth_set_fields, "truth set", 'truth_set_id'),
+    'benchmark_tool': (BenchmarkTool, benchmark_tool_fields, "benchmark tool", 'benchmark_tool_id'),
+    'variant': (Variant, variant_fields, "variant", 'variant_id'),
+    'chemistry': (Chemistry, chemistry_fields, "chemistry", 'chemistry_id'),
+    'qc': (QualityControl, quality_control_fields, "quality control", 'quality_control_metrics_id')
+}
+
+# ============================================================================
+# BATCH RECORD CREATION
+# ============================================================================
+
+def normalize_fields(model_class, fields):
+    """
+    Convert field values to what the database stores (NaN -> None, numbers in
+    string columns -> str), so new rows compare equal to the rows read back.
+    """
+    columns = model_class.__table__.c
+    normalized = {}
+    for key, value in fields.items():
+        if isinstance(value, (enum.Enum, bool, str)) or value is None:
+            pass
+        elif pd.isna(value):
+            value = None
+        elif isinstance(columns[key].type, String):
+            value = str(value)
+        normalized[key] = value
+    return normalized
+
+def missing_required_fields(model_class, fields):
+    """Return names of NOT NULL columns left empty in fields."""
+    return [
+        column.name for column in model_class.__table__.c
+        if not column.nullable and not column.primary_key and fields.get(column.name) is None
+    ]
+
+def insert_returning_ids(session, model_class, records):
+    """
+    Insert records with executemany batches of BATCH_SIZE.
+    
+    Returns:
+        list: New primary keys, in the same order as records
+    """
+    ids = []
+    stmt = insert(model_class).returning(model_class.id, sort_by_parameter_order=True)
+    for start in range(0, len(records), BATCH_SIZE):
+        ids.extend(session.scalars(stmt, records[start:start + BATCH_SIZE]).all())
+    return ids
 
-def add_experiment(session, row, metadata_objects):
-    """Create Experiment record linking all metadata"""
+def resolve_records(session, model_class, row_fields, record_name):
+    """
+    Get or create the records for a batch of CSV rows.
+    
+    Existing records are read once and matched in memory by their filter fields;
+    records not found are inserted in one batch, so duplicate rows in the CSV
+    share a single record.
+    
+    Args:
+        session: Active SQLAlchemy database session
+        model_class: SQLAlchemy model class (e.g., SequencingTechnology, VariantCaller)
+        row_fields (list): Per-row (filter_fields, all_fields) tuples, or None for rows without a record
+        record_name (str): Human-readable description for logging
+        
+    Returns:
+        list: Record id per row (None for rows without a record)
+    """
+    filter_keys = None
+    keys = []
+    new_records = {}
+    
+    for fields in row_fields:
+        if fields is None:
+            keys.append(None)
+            continue
+        filter_fields, all_fields = fields
+        filter_keys = filter_keys or list(filter_fields)
+        filter_fields = normalize_fields(model_class, filter_fields)
+        key = tuple(filter_fields[name] for name in filter_keys)
+        keys.append(key)
+        if key not in new_records:
+            new_records[key] = {**normalize_fields(model_class, all_fields), **filter_fields}
+    
+    if not new_records:
+        return keys
+    
+    # Existing records keyed by their filter fields
+    existing = {}
+    for record in session.scalars(select(model_class)):
+        existing.setdefault(tuple(getattr(record, name) for name in filter_keys), record.id)
+    
+    to_create = [key for key in new_records if key not in existing]
+    if to_create:
+        new_ids = insert_returning_ids(session, model_class, [new_records[key] for key in to_create])
+        existing.update(zip(to_create, new_ids))
+        logger.debug(f"Added {len(to_create)} {record_name} records")
+    
+    return [existing[key] if key is not None else None for key in keys]
+
+def experiment_fields(row, metadata_ids):
+    """Experiment fields from CSV row, linking the resolved metadata ids"""
     experiment_name = row['name']
     description = row.get('description', f"Benchmarking experiment for {experiment_name}")
     csv_id = row.get('ID')  # GET CSV ID
@@ -260,100 +364,156 @@ def add_experiment(session, row, metadata_objects):
             logger.warning(f"Could not parse created_at for experiment {csv_id}: {e}")
             created_at = None
     
-    # Check if experiment already exists BY ID
-    existing_experiment = session.query(Experiment).filter_by(id=csv_id).first()
-    
-    if existing_experiment:
-        logger.warning(f"Experiment ID {csv_id} already exists: {experiment_name}")
-        return existing_experiment
-    
-    try:
-        new_experiment = Experiment(
-            id=csv_id,  # SET ID FROM CSV
-            name=experiment_name,
-            description=description,
-            created_at = created_at,
-            sequencing_technology_id=metadata_objects['seq_tech'].id if metadata_objects['seq_tech'] else None,
-            variant_caller_id=metadata_objects['caller'].id if metadata_objects['caller'] else None,
-            aligner_id=metadata_objects['aligner'].id if metadata_objects['aligner'] else None,
-            truth_set_id=metadata_objects['truth_set'].id if metadata_objects['truth_set'] else None,
-            benchmark_tool_id=metadata_objects['benchmark_tool'].id if metadata_objects['benchmark_tool'] else None,
-            variant_id=metadata_objects['variant'].id if metadata_objects['variant'] else None,
-            chemistry_id=metadata_objects['chemistry'].id if metadata_objects['chemistry'] else None,
-            quality_control_metrics_id=metadata_objects['qc'].id if metadata_objects['qc'] else None
-        )
-        
-        session.add(new_experiment)
-        session.flush()
-        logger.info(f"Created experiment: {experiment_name} (ID: {new_experiment.id})")
-        return new_experiment
-                    
-    except Exception as e:
-        logger.error(f"Error adding experiment {experiment_name}: {e}")
-        return None
+    return {
+        'id': int(csv_id) if pd.notna(csv_id) else None,  # SET ID FROM CSV
+        'name': experiment_name,
+        'description': description,
+        'created_at': created_at,
+        **{METADATA_RECORDS[key][3]: record_id for key, record_id in metadata_ids.items()}
+    }
 
 # ============================================================================
 # MAIN POPULATION FUNCTION
 # ============================================================================
 
+def populate_chunk(session, metadata_df):
+    """
+    Create metadata records, experiments and hap.py results for one chunk of CSV rows.
+    
+    Metadata records and experiments are created in batches (one executemany
+    INSERT per table) and the new experiments get their experiment_flat rows;
+    hap.py results are then loaded per experiment.
+    
+    Args:
+        session: Active SQLAlchemy database session
+        metadata_df (pandas.DataFrame): Cleaned and enum-mapped CSV rows
+        
+    Returns:
+        int: Number of experiments processed
+    """
+    success_count = 0
+    
+    # Plain dict per row (no per-row Series construction)
+    rows = metadata_df.to_dict('records')
+    
+    # Build metadata fields per row; rows missing required values are skipped
+    row_fields = {key: [] for key in METADATA_RECORDS}
+    valid_rows = []
+    for row in rows:
+        try:
+            fields = {key: builder(row) for key, (_, builder, _, _) in METADATA_RECORDS.items()}
+            for key, (model_class, _, record_name, _) in METADATA_RECORDS.items():
+                missing = fields[key] and missing_required_fields(model_class, fields[key][1])
+                if missing:
+                    raise ValueError(f"{record_name} is missing {', '.join(missing)}")
+        except Exception as e:
+            logger.error(f"Failed to process experiment {row.get('name', 'Unknown')}: {e}")
+            continue
+        
+        valid_rows.append(row)
+        for key in METADATA_RECORDS:
+            row_fields[key].append(fields[key])
+    
+    # Create all metadata records (one batch per table)
+    metadata_ids = {
+        key: resolve_records(session, model_class, row_fields[key], record_name)
+        for key, (model_class, _, record_name, _) in METADATA_RECORDS.items()
+    }
+    
+    # Create experiments; rows whose ID already exists keep the existing experiment
+    existing_ids = set(session.scalars(select(Experiment.id)))
+    experiment_ids = []
+    new_experiments = []
+    for index, row in enumerate(valid_rows):
+        fields = experiment_fields(row, {key: ids[index] for key, ids in metadata_ids.items()})
+        if fields['id'] is not None and fields['id'] in existing_ids:
+            logger.warning(f"Experiment ID {fields['id']} already exists: {fields['name']}")
+            experiment_ids.append(fields['id'])
+            continue
+        if fields['id'] is not None:
+            existing_ids.add(fields['id'])
+        experiment_ids.append(None)
+        new_experiments.append((index, fields))
+    
+    created_ids = insert_returning_ids(session, Experiment, [fields for _, fields in new_experiments])
+    for (index, fields), experiment_id in zip(new_experiments, created_ids):
+        experiment_ids[index] = experiment_id
+        logger.debug(f"Created experiment: {fields['name']} (ID: {experiment_id})")
+    logger.info(f"Created {len(created_ids)} experiments")
+    
+    # Overview rows for the new experiments, committed with the chunk
+    refresh_experiment_flat(session, created_ids)
+    
+    # Experiments that already had results are not re-parsed (one query for the chunk)
+    reused_ids = set(experiment_ids) - set(created_ids)
+    loaded_ids = set(session.scalars(
+        select(OverallResult.experiment_id).where(OverallResult.experiment_id.in_(reused_ids)).union(
+            select(BenchmarkResult.experiment_id).where(BenchmarkResult.experiment_id.in_(reused_ids))
+        )
+    )) if reused_ids else set()
+    
+    # Parse hap.py results if available; rows for the whole chunk are inserted together
+    benchmark_records = []
+    overall_records = []
+    for row, experiment_id in zip(valid_rows, experiment_ids):
+        try:
+            file_name = row.get('file_name')
+            if experiment_id in loaded_ids:
+                logger.debug(f"Results already exist for experiment {experiment_id}")
+            elif file_name and not pd.isna(file_name):
+                records = build_happy_records(file_name, experiment_id)
+                if records["success"]:
+                    benchmark_records.extend(records["benchmark_records"])
+                    overall_records.extend(records["overall_records"])
+                    loaded_ids.add(experiment_id)
+                    result = summarize_happy_records(experiment_id, records)
+                    logger.debug(f"Loaded results: {result['message']}")
+                else:
+                    logger.warning(f"Failed to load results: {records.get('error')}")
+            
+            success_count += 1
+            logger.debug(f"Completed setup for experiment {experiment_id}")
+            
+        except Exception as e:
+            logger.error(f"Failed to process experiment {row.get('name', 'Unknown')}: {e}")
+            continue
+    
+    insert_happy_records(session, benchmark_records, overall_records)
+    
+    return success_count
+
 def populate_database_from_csv(file_path=METADATA_CSV_PATH):
-    """Main function to populate database from CSV metadata and hap.py files"""
+    """
+    Main function to populate database from CSV metadata and hap.py files.
+    
+    The CSV is read and processed in chunks of CHUNK_SIZE rows, committing
+    after each chunk so memory stays bounded and finished chunks are kept.
+    """
     logger.info("Starting database population from CSV")
     
     # Load and validate CSV
-    raw_df = load_csv_metadata(file_path)
-    if raw_df is None:
+    metadata_chunks = load_csv_metadata(file_path)
+    if metadata_chunks is None:
         logger.error("Failed to load metadata CSV")
         return False
     
-    # Clean and process data
-    raw_df = raw_df.dropna(subset=['name'])
-    metadata_df = clean_dataframe_strings(raw_df)
-    logger.info(f"Processing {len(metadata_df)} experiments")
-
     success_count = 0
+    total_count = 0
     
     try:
         with get_db_session() as session:
-            for index, row in metadata_df.iterrows():
-                try:
-                    logger.info(f"Processing experiment {index + 1}: {row.get('name', 'Unknown')}")
-                                        
-                    # Create all metadata records
-                    metadata_objects = {
-                        'seq_tech': add_sequencing_tech(session, row),
-                        'caller': add_variant_caller(session, row),
-                        'aligner': add_aligner(session, row),
-                        'truth_set': add_truth_set(session, row),
-                        'benchmark_tool': add_benchmark_tool(session, row),
-                        'variant': add_variant(session, row),
-                        'chemistry': add_chemistry(session, row),
-                        'qc': add_quality_control(session, row)
-                    }
-
-                    # Create experiment
-                    experiment = add_experiment(session, row, metadata_objects)
-                    if not experiment:
-                        logger.warning(f"Failed to create experiment for {row['name']}")
-                        continue
-                    
-                    # Parse hap.py results if available
-                    file_name = row.get('file_name')
-                    if file_name and not pd.isna(file_name):
-                        result = parse_happy_csv(file_name, experiment.id, session)
-                        if result["success"]:
-                            logger.info(f"Loaded results: {result['message']}")
-                        else:
-                            logger.warning(f"Failed to load results: {result.get('error')}")
-                    
-                    success_count += 1
-                    logger.info(f"Completed setup for experiment {row.get('ID', index+1)}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to process experiment {row.get('name', 'Unknown')}: {e}")
-                    continue
+            for raw_df in metadata_chunks:
+                # Clean and process data
+                metadata_df = raw_df.dropna(subset=['name'])
+                del raw_df
+                metadata_df = apply_enum_mappings(clean_dataframe_strings(metadata_df))
+                logger.info(f"Processing {len(metadata_df)} experiments")
+                
+                success_count += populate_chunk(session, metadata_df)
+                total_count += len(metadata_df)
+                session.commit()
             
-        logger.info(f"Database population completed: {success_count}/{len(metadata_df)} experiments processed")
+        logger.info(f"Database population completed: {success_count}/{total_count} experiments processed")
         return True
         
     except Exception as e:
@@ -0,0 +1,61 @@
+# ============================================================================
+# cache.py
+# ============================================================================
+"""
+In-process TTL cache for SNV Benchmarking Dashboard.
+
+Main components:
+- Cache-aside get_cached/set_cached with per-entry expiry
+- Invalidation by exact key or key prefix
+
+The dashboard runs as a single R Shiny process calling into Python,
+so a module-level dict is shared by every lookup in that process.
+"""
+
+import copy
+import time
+import threading
+
+DEFAULT_TTL = 300  # seconds
+
+_store = {}
+_lock = threading.Lock()
+
+# ============================================================================
+# CACHE OPERATIONS
+# ============================================================================
+
+def get_cached(key):
+    """Return cached value for key, or None if missing/expired."""
+    with _lock:
+        entry = _store.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del _store[key]
+            return None
+    # Hand out a copy so callers can't mutate the cached value
+    return copy.copy(value)
+
+def set_cached(key, value, ttl=DEFAULT_TTL):
+    """Store value under key for ttl seconds."""
+    with _lock:
+        _store[key] = (time.monotonic() + ttl, value)
+
+def invalidate(*keys):
+    """Drop the given keys from the cache."""
+    with _lock:
+        for key in keys:
+            _store.pop(key, None)
+
+def invalidate_prefix(prefix):
+    """Drop every key starting with prefix (e.g. 'user:name:')."""
+    with _lock:
+        for key in [k for k in _store if k.startswith(prefix)]:
+            del _store[key]
+
+def clear():
+    """Empty the whole cache."""
+    with _lock:
+        _store.clear()
@@ -50,6 +50,14 @@ DATABASE_PATH = os.path.join(DATA_FOLDER if IS_CONTAINER else os.path.join(PROJE
 METADATA_CSV_FILENAME = '000_benchmark_dashboard_default_metadata.csv'
 DELETED_CSV_PATH = os.path.join(DATA_FOLDER, '000_deleted.csv')
 
+# Database connection pool (overridable per deployment)
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 20))
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 1800))  # seconds
+# SQLite page cache per pooled connection, in KiB. Worst case is
+# (DB_POOL_SIZE + DB_MAX_OVERFLOW) * DB_CACHE_SIZE_KB, i.e. ~600 MB with the defaults
+DB_CACHE_SIZE_KB = int(os.environ.get("DB_CACHE_SIZE_KB", 20000))
+
 def get_data_file_path(filename):
     return os.path.join(DATA_FOLDER, filename)
 
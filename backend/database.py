@@ -15,7 +15,7 @@ import logging
 from contextlib import contextmanager
 from sqlalchemy import create_engine, text, event
 from sqlalchemy.orm import sessionmaker
-from config import DATABASE_PATH, DATA_FOLDER
+from config import DATABASE_PATH, DATA_FOLDER, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE, DB_CACHE_SIZE_KB
 from models import Base
 
 logger = logging.getLogger(__name__)
@@ -30,14 +30,33 @@ if not os.path.exists(data_dir):
 
 DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 
-engine = create_engine(DATABASE_URL)
-Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# One engine (and QueuePool) per process: every get_db_session() checks a pooled
+# connection out of it. check_same_thread=False lets the pool hand a connection
+# to whichever thread Shiny calls in from. Sizes come from config (env overridable)
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE,
+    query_cache_size=1200,
+    connect_args={"check_same_thread": False}
+)
+
+# expire_on_commit=False: objects stay readable after commit without a reload query
+Session = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # SQLite safety settings (must be AFTER engine creation)
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")  # safe with WAL, fewer fsyncs per commit
+    # Read-heavy workload: larger page cache (DB_CACHE_SIZE_KB per connection, filled on demand),
+    # memory-mapped reads (256 MB, shared OS pages) and in-memory temp tables for sorts/DISTINCT
+    cursor.execute(f"PRAGMA cache_size=-{DB_CACHE_SIZE_KB}")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA temp_store=MEMORY")
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.close()
 
@@ -59,6 +78,20 @@ def get_db_session():
     finally:
         session.close()
 
+@contextmanager
+def use_session(session=None):
+    """
+    Reuse a caller-provided session, or open a new one via get_db_session().
+    
+    Lets callers run several query functions on one session/connection;
+    commit and close stay with whoever opened the session.
+    """
+    if session is not None:
+        yield session
+    else:
+        with get_db_session() as new_session:
+            yield new_session
+
 def get_engine():
     """Return the SQLAlchemy engine."""
     return engine
@@ -74,6 +107,8 @@ def migrate_database():
         ("experiments", "is_public", "BOOLEAN DEFAULT 1"),
         ("experiments", "created_by_username", "VARCHAR(100)"),
         ("experiments", "owner_id", "INTEGER REFERENCES users(id)"),
+        # users table - denormalized experiment counter
+        ("users", "experiment_count", "INTEGER NOT NULL DEFAULT 0"),
     ]
     
     with engine.connect() as conn:
@@ -87,12 +122,77 @@ def migrate_database():
                     logger.info(f"Added column {column} to {table}")
                 except Exception as e:
                     logger.warning(f"Could not add {column} to {table}: {e}")
+        
+        create_experiment_count_triggers(conn)
+
+
+# Keep users.experiment_count in sync with experiments.owner_id. Triggers (not ORM
+# events) so that bulk/Core deletes in delete_handler are counted too.
+EXPERIMENT_COUNT_TRIGGERS = {
+    "trg_experiments_owner_insert": """
+        CREATE TRIGGER trg_experiments_owner_insert AFTER INSERT ON experiments
+        WHEN NEW.owner_id IS NOT NULL
+        BEGIN
+            UPDATE users SET experiment_count = experiment_count + 1 WHERE id = NEW.owner_id;
+        END""",
+    "trg_experiments_owner_delete": """
+        CREATE TRIGGER trg_experiments_owner_delete AFTER DELETE ON experiments
+        WHEN OLD.owner_id IS NOT NULL
+        BEGIN
+            UPDATE users SET experiment_count = experiment_count - 1 WHERE id = OLD.owner_id;
+        END""",
+    "trg_experiments_owner_update": """
+        CREATE TRIGGER trg_experiments_owner_update AFTER UPDATE OF owner_id ON experiments
+        WHEN OLD.owner_id IS NOT NEW.owner_id
+        BEGIN
+            UPDATE users SET experiment_count = experiment_count - 1 WHERE id = OLD.owner_id;
+            UPDATE users SET experiment_count = experiment_count + 1 WHERE id = NEW.owner_id;
+        END""",
+}
+
+def create_experiment_count_triggers(conn):
+    """Create missing experiment counter triggers and backfill the counts once."""
+    existing = set(conn.execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    ).scalars())
+    missing = [name for name in EXPERIMENT_COUNT_TRIGGERS if name not in existing]
+    if not missing:
+        return
+    
+    try:
+        for name in missing:
+            conn.execute(text(EXPERIMENT_COUNT_TRIGGERS[name]))
+        # Recount from scratch so existing rows match the triggers from here on
+        conn.execute(text(
+            "UPDATE users SET experiment_count = "
+            "(SELECT COUNT(*) FROM experiments WHERE experiments.owner_id = users.id)"
+        ))
+        conn.commit()
+        logger.info(f"Created experiment count triggers: {missing}")
+    except Exception as e:
+        conn.rollback()
+        logger.warning(f"Could not create experiment count triggers: {e}")
+
+
+def create_indexes():
+    """Create model indexes missing from existing tables (create_all skips existing tables)."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(bind=engine, checkfirst=True)
+            except Exception as e:
+                logger.warning(f"Could not create index {index.name}: {e}")
 
 
 def create_tables():
     """Create tables if they don't exist, then run migrations."""
     Base.metadata.create_all(bind=engine)
     migrate_database()
+    create_indexes()
+    
+    # Imported here: experiment_flat imports this module
+    from experiment_flat import rebuild_experiment_flat
+    rebuild_experiment_flat()
 
 def test_connection():
     """Test database connectivity."""
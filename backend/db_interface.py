@@ -21,21 +21,46 @@ Visibility Rules:
 import pandas as pd
 import json
 import logging
-from sqlalchemy.orm import joinedload
-from sqlalchemy import or_
-from database import get_db_session
+from sqlalchemy.orm import joinedload, load_only, raiseload
+from sqlalchemy import or_, update, select, func, bindparam, literal, cast, union_all, case, String
+from database import get_db_session, use_session
 from models import *
 from authorization import require_admin
+import cache
 import os
 from config import DATA_FOLDER
 
 
 logger = logging.getLogger(__name__)
 
+# Enum-typed columns in get_experiments_with_performance output (returned as .value strings)
+PERFORMANCE_ENUM_COLUMNS = [
+    'technology', 'platform_type', 'target', 'caller', 'caller_type',
+    'truth_set', 'truth_set_sample', 'truth_set_reference', 'benchmark_tool_name',
+    'variant_type_detail', 'variant_origin', 'variant_size'
+]
+
+# Enum-typed columns in get_experiment_metadata output
+METADATA_ENUM_COLUMNS = [
+    'technology', 'target', 'platform_type', 'caller', 'caller_type',
+    'truth_set_name', 'truth_set_sample', 'truth_set_reference', 'benchmark_tool_name',
+    'variant_type', 'variant_origin', 'variant_size'
+]
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Filter value -> enum member lookups, built once instead of per call
+TECH_LOOKUP = {tech.value: tech for tech in SeqTechName}
+CALLER_LOOKUP = {caller.value: caller for caller in CallerName}
+
+def lookup_enum(lookup, value):
+    """Resolve a filter string (case-insensitive) to its enum member, or None if invalid."""
+    if value is None:
+        return None
+    return lookup.get(str(value).strip().upper())
+
 def parse_experiment_ids(experiment_ids_param):
     """
     Parse experiment IDs from various input formats.
@@ -68,7 +93,7 @@ def parse_experiment_ids(experiment_ids_param):
         logger.error(f"Error processing experiment_ids: {e}")
         return []
 
-def apply_visibility_filter(query, user_id=None, is_admin=False):
+def apply_visibility_filter(query, user_id=None, is_admin=False, model=Experiment):
     """
     Apply visibility filtering to experiment query.
     
@@ -82,6 +107,7 @@ def apply_visibility_filter(query, user_id=None, is_admin=False):
         query: SQLAlchemy query object
         user_id: Current user's database ID (None if anonymous)
         is_admin: Whether current user is admin
+        model: Table holding is_public/owner_id (Experiment or ExperimentFlat)
         
     Returns:
         query: Filtered query object
@@ -93,25 +119,87 @@ def apply_visibility_filter(query, user_id=None, is_admin=False):
         # Authenticated: public + own private + legacy (owner_id=NULL)
         return query.filter(
             or_(
-                Experiment.is_public == True,
-                Experiment.owner_id == user_id,
-                Experiment.owner_id.is_(None)  # Legacy public data
+                model.is_public == True,
+                model.owner_id == user_id,
+                model.owner_id.is_(None)  # Legacy public data
             )
         )
     else:
         # Anonymous: public only + legacy
         return query.filter(
             or_(
-                Experiment.is_public == True,
-                Experiment.owner_id.is_(None)
+                model.is_public == True,
+                model.owner_id.is_(None)
             )
         )
 
+def enum_display(series, missing="N/A"):
+    """Map an enum-valued column to display values (.value), missing -> placeholder."""
+    return series.map(lambda v: v.value if v is not None else missing)
+
+def enum_value_expr(column, enum_cls, missing=None):
+    """SQL expression for an enum column's display value (stored names -> .value), NULL -> missing."""
+    return case(
+        {member.name: member.value for member in enum_cls},
+        value=cast(column, String),
+        else_=missing
+    )
+
+def date_display(series, fmt='%Y-%m-%d', missing="N/A"):
+    """Format a datetime column as strings, missing -> placeholder."""
+    dates = pd.to_datetime(series)
+    return dates.dt.strftime(fmt).where(dates.notna(), missing)
+
+def isoformat_display(series, missing=None):
+    """Column-wise datetime.isoformat(): microseconds only when non-zero, missing -> placeholder."""
+    dates = pd.to_datetime(series)
+    iso = dates.dt.strftime('%Y-%m-%dT%H:%M:%S')
+    micro = dates.dt.microsecond.fillna(0).astype(int)
+    iso = iso.where(micro == 0, iso + '.' + micro.astype(str).str.zfill(6))
+    return iso.astype(object).where(dates.notna(), missing)
+
 # ============================================================================
 # EXPERIMENT OVERVIEW AND METADATA
 # ============================================================================
 
-def get_experiments_overview(filters=None, experiment_ids_param=None, user_id=None, is_admin=False):
+OVERVIEW_CACHE_PREFIX = "overview:"
+
+def _overview_cache_key(filters, experiment_ids, user_id, is_admin):
+    """
+    Build the overview cache key from the normalized arguments. Every writer
+    (create, upload, delete, visibility toggle, login email refresh) drops
+    the OVERVIEW_CACHE_PREFIX keys after its commit.
+    """
+    normalized = {
+        'filters': {k: str(v).upper() for k, v in (filters or {}).items()},
+        'ids': sorted(experiment_ids or []),
+        'user_id': user_id,
+        'is_admin': bool(is_admin)
+    }
+    return OVERVIEW_CACHE_PREFIX + json.dumps(normalized, sort_keys=True, default=str)
+
+# Base overview statement, built once; filters are added per call.
+# Denormalized experiment_flat: enum display values already resolved,
+# only the (mutable) owner email is joined in
+_OVERVIEW_STMT = select(
+    ExperimentFlat.id,
+    ExperimentFlat.name,
+    ExperimentFlat.technology,
+    ExperimentFlat.platform_name,
+    ExperimentFlat.caller,
+    ExperimentFlat.caller_version,
+    ExperimentFlat.chemistry,
+    ExperimentFlat.truth_set,
+    ExperimentFlat.sample,
+    ExperimentFlat.created_at,
+    ExperimentFlat.is_public,
+    ExperimentFlat.owner_id,
+    User.email.label('owner_username')
+).select_from(ExperimentFlat).outerjoin(
+    User, ExperimentFlat.owner_id == User.id
+).order_by(ExperimentFlat.id)
+
+def get_experiments_overview(filters=None, experiment_ids_param=None, user_id=None, is_admin=False, session=None):
     """
     Get basic experiment information for dashboard overview table.
     
@@ -122,6 +210,7 @@ def get_experiments_overview(filters=None, experiment_ids_param=None, user_id=No
         experiment_ids_param (str/list): JSON string or list of specific experiment IDs
         user_id (int): Current user's database ID for visibility filtering
         is_admin (bool): Whether current user is admin
+        session (Session): Optional existing session to reuse
         
     Returns:
         pandas.DataFrame: Experiment overview with visibility info
@@ -129,76 +218,83 @@ def get_experiments_overview(filters=None, experiment_ids_param=None, user_id=No
     experiment_ids = parse_experiment_ids(experiment_ids_param)
 
     try:
-        with get_db_session() as session:
-            # Base query with joins
-            query = session.query(Experiment).options(
-                joinedload(Experiment.sequencing_technology),
-                joinedload(Experiment.variant_caller),
-                joinedload(Experiment.truth_set), 
-                joinedload(Experiment.chemistry),
-                joinedload(Experiment.owner)
-            )
+        # Cached per filter/visibility combination (only when not inside a caller's session)
+        cache_key = None
+        if session is None:
+            cache_key = _overview_cache_key(filters, experiment_ids, user_id, is_admin)
+            cached = cache.get_cached(cache_key)
+            if cached is not None:
+                return cached
+        
+        with use_session(session) as session:
+            query = _OVERVIEW_STMT
             
             # Apply visibility filter
-            query = apply_visibility_filter(query, user_id, is_admin)
+            query = apply_visibility_filter(query, user_id, is_admin, model=ExperimentFlat)
             
             # Filter by specific IDs if provided
             if experiment_ids and len(experiment_ids) > 0:
-                query = query.filter(Experiment.id.in_(experiment_ids))
+                query = query.filter(ExperimentFlat.id.in_(experiment_ids))
             
             # Apply additional filters
             if filters:
                 if 'technology' in filters:
-                    try:
-                        tech_enum = SeqTechName(filters['technology'].upper())
-                        query = query.join(SequencingTechnology).filter(
-                            SequencingTechnology.technology == tech_enum
-                        )
-                    except ValueError:
+                    tech_enum = lookup_enum(TECH_LOOKUP, filters['technology'])
+                    if tech_enum is None:
                         logger.error(f"Invalid technology filter: {filters['technology']}")
                         return pd.DataFrame()
+                    query = query.filter(ExperimentFlat.technology == tech_enum.value)
                 
                 if 'caller' in filters:
-                    try:
-                        caller_enum = CallerName(filters['caller'].upper())
-                        query = query.join(VariantCaller).filter(
-                            VariantCaller.name == caller_enum
-                        )
-                    except ValueError:
+                    caller_enum = lookup_enum(CALLER_LOOKUP, filters['caller'])
+                    if caller_enum is None:
                         logger.error(f"Invalid caller filter: {filters['caller']}")
                         return pd.DataFrame()
+                    query = query.filter(ExperimentFlat.caller == caller_enum.value)
             
-            experiments = query.all()
-            
-            # Build result data
-            data = []
-            for exp in experiments:
-                data.append({ 
-                    'id': exp.id,
-                    'name': exp.name,
-                    'technology': exp.sequencing_technology.technology.value if exp.sequencing_technology else "N/A",
-                    'platform_name': exp.sequencing_technology.platform_name if (exp.sequencing_technology and exp.sequencing_technology.platform_name) else "N/A",
-                    'caller': exp.variant_caller.name.value if exp.variant_caller else "N/A",
-                    'caller_version': exp.variant_caller.version if (exp.variant_caller and exp.variant_caller.version) else "N/A",
-                    'chemistry': exp.chemistry.name if (exp.chemistry and exp.chemistry.name) else "N/A",
-                    'truth_set': exp.truth_set.name.value if exp.truth_set else "N/A",
-                    'sample': exp.truth_set.sample.value if exp.truth_set else "N/A",
-                    'created_at': exp.created_at.strftime('%Y-%m-%d') if exp.created_at else "N/A",
-                    # Visibility info
-                    'is_public': exp.is_public if exp.is_public is not None else True,
-                    'owner_id': exp.owner_id,
-                    'owner_username': exp.owner.email if exp.owner else None,
-                })
-            
-            return pd.DataFrame(data)
+            df = pd.read_sql(query, session.connection())
+        
+        if df.empty:
+            df = pd.DataFrame()
+            if cache_key:
+                cache.set_cached(cache_key, df)
+            return df
+        
+        # Missing metadata -> "N/A"
+        for col in ['technology', 'caller', 'truth_set', 'sample']:
+            df[col] = df[col].fillna("N/A")
+        for col in ['platform_name', 'caller_version', 'chemistry']:
+            df[col] = df[col].where(df[col].notna() & (df[col] != ""), "N/A")
+        df['created_at'] = date_display(df['created_at'])
+        
+        # Visibility info (NULL is_public = legacy public)
+        df['is_public'] = df['is_public'].map(lambda v: True if v is None else bool(v))
+        
+        if cache_key:
+            cache.set_cached(cache_key, df.copy())
+        return df
             
-    except Exception as e:
-        logger.error(f"Error in get_experiments_overview: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error in get_experiments_overview")
         return pd.DataFrame()
 
-def get_experiment_metadata(experiment_ids_param, user_id=None, is_admin=False):
+# All nine relationships are many-to-one (uselist=False): a LEFT JOIN adds
+# at most one row each, so joinedload keeps this a single query with no
+# row multiplication. Use selectinload only for collections (e.g. benchmark_results).
+_METADATA_STMT = select(Experiment).options(
+    joinedload(Experiment.sequencing_technology),
+    joinedload(Experiment.variant_caller),
+    joinedload(Experiment.aligner),
+    joinedload(Experiment.truth_set),
+    joinedload(Experiment.benchmark_tool),
+    joinedload(Experiment.variant),
+    joinedload(Experiment.chemistry),
+    joinedload(Experiment.quality_control),
+    joinedload(Experiment.owner),
+    raiseload('*')  # any relationship not listed above raises instead of lazy loading
+)
+
+def get_experiment_metadata(experiment_ids_param, user_id=None, is_admin=False, session=None):
     """
     Get complete metadata for specific experiments.
     
@@ -206,6 +302,7 @@ def get_experiment_metadata(experiment_ids_param, user_id=None, is_admin=False):
         experiment_ids_param (str/list): JSON string or list of experiment IDs
         user_id (int): Current user's database ID for visibility filtering
         is_admin (bool): Whether current user is admin
+        session (Session): Optional existing session to reuse
         
     Returns:
         pandas.DataFrame: Complete metadata for selected experiments
@@ -217,23 +314,13 @@ def get_experiment_metadata(experiment_ids_param, user_id=None, is_admin=False):
         return pd.DataFrame()
     
     try:
-        with get_db_session() as session:
-            query = session.query(Experiment).options(
-                joinedload(Experiment.sequencing_technology),
-                joinedload(Experiment.variant_caller),
-                joinedload(Experiment.aligner),
-                joinedload(Experiment.truth_set),
-                joinedload(Experiment.benchmark_tool),
-                joinedload(Experiment.variant),
-                joinedload(Experiment.chemistry),
-                joinedload(Experiment.quality_control),
-                joinedload(Experiment.owner)
-            ).filter(Experiment.id.in_(experiment_ids))
+        with use_session(session) as session:
+            query = _METADATA_STMT.where(Experiment.id.in_(experiment_ids))
             
             # Apply visibility filter
             query = apply_visibility_filter(query, user_id, is_admin)
             
-            experiments = query.all()
+            experiments = session.execute(query).scalars().all()
             
             data = []
             for exp in experiments:
@@ -242,7 +329,7 @@ def get_experiment_metadata(experiment_ids_param, user_id=None, is_admin=False):
                     'id': exp.id,
                     'name': exp.name,
                     'description': exp.description,
-                    'created_at': exp.created_at.isoformat() if exp.created_at else None,
+                    'created_at': exp.created_at,
                     
                     # Visibility
                     'is_public': exp.is_public if exp.is_public is not None else True,
@@ -250,15 +337,15 @@ def get_experiment_metadata(experiment_ids_param, user_id=None, is_admin=False):
                     'owner_username': exp.owner.email if exp.owner else None,
                     
                     # Sequencing Technology
-                    'technology': exp.sequencing_technology.technology.value if exp.sequencing_technology else None,
-                    'target': exp.sequencing_technology.target.value if exp.sequencing_technology else None,
+                    'technology': exp.sequencing_technology.technology if exp.sequencing_technology else None,
+                    'target': exp.sequencing_technology.target if exp.sequencing_technology else None,
                     'platform_name': exp.sequencing_technology.platform_name if exp.sequencing_technology else None,
-                    'platform_type': exp.sequencing_technology.platform_type.value if exp.sequencing_technology else None,
+                    'platform_type': exp.sequencing_technology.platform_type if exp.sequencing_technology else None,
                     'platform_version': exp.sequencing_technology.platform_version if exp.sequencing_technology else None,
                     
                     # Variant Caller
-                    'caller': exp.variant_caller.name.value if exp.variant_caller else None,
-                    'caller_type': exp.variant_caller.type.value if exp.variant_caller else None,
+                    'caller': exp.variant_caller.name if exp.variant_caller else None,
+                    'caller_type': exp.variant_caller.type if exp.variant_caller else None,
                     'caller_version': exp.variant_caller.version if exp.variant_caller else None,
                     'caller_model': exp.variant_caller.model if exp.variant_caller else None,
                     
@@ -267,33 +354,41 @@ def get_experiment_metadata(experiment_ids_param, user_id=None, is_admin=False):
                     'aligner_version': exp.aligner.version if exp.aligner else None,
                     
                     # Truth Set
-                    'truth_set_name': exp.truth_set.name.value if exp.truth_set else None,
-                    'truth_set_sample': exp.truth_set.sample.value if exp.truth_set else None,
+                    'truth_set_name': exp.truth_set.name if exp.truth_set else None,
+                    'truth_set_sample': exp.truth_set.sample if exp.truth_set else None,
                     'truth_set_version': exp.truth_set.version if exp.truth_set else None,
-                    'truth_set_reference': exp.truth_set.reference.value if exp.truth_set else None,
+                    'truth_set_reference': exp.truth_set.reference if exp.truth_set else None,
                     
                     # Benchmark Tool
-                    'benchmark_tool_name': exp.benchmark_tool.name.value if exp.benchmark_tool else None,
+                    'benchmark_tool_name': exp.benchmark_tool.name if exp.benchmark_tool else None,
                     'benchmark_tool_version': exp.benchmark_tool.version if exp.benchmark_tool else None,
                     
                     # Variant Info
-                    'variant_type': exp.variant.type.value if exp.variant else None,
-                    'variant_origin': exp.variant.origin.value if exp.variant else None,
-                    'variant_size': exp.variant.size.value if exp.variant else None,
+                    'variant_type': exp.variant.type if exp.variant else None,
+                    'variant_origin': exp.variant.origin if exp.variant else None,
+                    'variant_size': exp.variant.size if exp.variant else None,
                     'is_phased': exp.variant.is_phased if exp.variant else None,
                     
-                    # Quality Control Metrics
-                    'mean_coverage': float(exp.quality_control.mean_coverage) if (exp.quality_control and exp.quality_control.mean_coverage is not None) else None,
-                    'read_length': float(exp.quality_control.read_length) if (exp.quality_control and exp.quality_control.read_length is not None) else None,
-                    'mean_read_length': float(exp.quality_control.mean_read_length) if (exp.quality_control and exp.quality_control.mean_read_length is not None) else None,
-                    'mean_insert_size': float(exp.quality_control.mean_insert_size) if (exp.quality_control and exp.quality_control.mean_insert_size is not None) else None,
+                    # Quality Control Metrics (Float columns - already floats or None)
+                    'mean_coverage': exp.quality_control.mean_coverage if exp.quality_control else None,
+                    'read_length': exp.quality_control.read_length if exp.quality_control else None,
+                    'mean_read_length': exp.quality_control.mean_read_length if exp.quality_control else None,
+                    'mean_insert_size': exp.quality_control.mean_insert_size if exp.quality_control else None,
                     
                     # Chemistry
                     'chemistry_name': exp.chemistry.name if exp.chemistry else None,
                     'chemistry_version': exp.chemistry.version if exp.chemistry else None,
                 })
             
-            return pd.DataFrame(data)
+            if not data:
+                return pd.DataFrame()
+            
+            # Enum members -> display values, one pass per column
+            df = pd.DataFrame(data)
+            for col in METADATA_ENUM_COLUMNS:
+                df[col] = enum_display(df[col], missing=None)
+            df['created_at'] = isoformat_display(df['created_at'])
+            return df
             
     except Exception as e:
         logger.error(f"Error in get_experiment_metadata: {e}")
@@ -314,6 +409,12 @@ def get_experiments_filtered(technology=None, platform=None, caller=None, versio
     Returns:
         list: Experiment IDs matching all specified criteria
     """
+    tech_enum = lookup_enum(TECH_LOOKUP, technology) if technology else None
+    caller_enum = lookup_enum(CALLER_LOOKUP, caller) if caller else None
+    if (technology and tech_enum is None) or (caller and caller_enum is None):
+        logger.error(f"Invalid filter in get_experiments_filtered: technology={technology}, caller={caller}")
+        return []
+    
     try:
         with get_db_session() as session:
             query = session.query(Experiment.id)
@@ -325,13 +426,11 @@ def get_experiments_filtered(technology=None, platform=None, caller=None, versio
                 query = query.join(VariantCaller)
             
             # Apply filters
-            if technology:
-                tech_enum = SeqTechName(technology.upper())
+            if tech_enum:
                 query = query.filter(SequencingTechnology.technology == tech_enum)
             if platform:
                 query = query.filter(SequencingTechnology.platform_name == platform)
-            if caller:
-                caller_enum = CallerName(caller.upper())
+            if caller_enum:
                 query = query.filter(VariantCaller.name == caller_enum)
             if version:
                 query = query.filter(VariantCaller.version == version)
@@ -347,9 +446,12 @@ def get_experiments_filtered(technology=None, platform=None, caller=None, versio
         return []
 def get_platforms_for_technology(technology, user_id=None, is_admin=False):
     """Get platforms available for a specific technology (visible to user)."""
+    tech_enum = lookup_enum(TECH_LOOKUP, technology)
+    if tech_enum is None:
+        logger.error(f"Invalid technology: {technology}")
+        return []
     try:
         with get_db_session() as session:
-            tech_enum = SeqTechName(technology.upper())
             query = session.query(SequencingTechnology.platform_name).join(Experiment).filter(
                 SequencingTechnology.technology == tech_enum,
                 SequencingTechnology.platform_name.isnot(None)
@@ -366,9 +468,12 @@ def get_platforms_for_technology(technology, user_id=None, is_admin=False):
 
 def get_versions_for_caller(caller, user_id=None, is_admin=False):
     """Get versions available for a specific caller (visible to user)."""
+    caller_enum = lookup_enum(CALLER_LOOKUP, caller)
+    if caller_enum is None:
+        logger.error(f"Invalid caller: {caller}")
+        return []
     try:
         with get_db_session() as session:
-            caller_enum = CallerName(caller.upper())
             query = session.query(VariantCaller.version).join(Experiment).filter(
                 VariantCaller.name == caller_enum,
                 VariantCaller.version.isnot(None)
@@ -386,9 +491,77 @@ def get_versions_for_caller(caller, user_id=None, is_admin=False):
 # PERFORMANCE DATA QUERIES
 # ============================================================================
 
-def get_experiments_with_performance(experiment_ids_param, variant_types=['SNP', 'INDEL']):
+# Base performance statement (metadata + overall results), built once
+_PERFORMANCE_STMT = select(
+    Experiment.id.label('experiment_id'),
+    Experiment.name.label('experiment_name'),
+    Experiment.is_public,
+    Experiment.owner_id,
+    SequencingTechnology.technology,
+    SequencingTechnology.platform_name,
+    SequencingTechnology.platform_type,
+    SequencingTechnology.target,
+    VariantCaller.name.label('caller'),
+    VariantCaller.version.label('caller_version'),
+    VariantCaller.type.label('caller_type'),
+    VariantCaller.model.label('caller_model'),
+    TruthSet.name.label('truth_set'),
+    TruthSet.sample.label('truth_set_sample'),
+    TruthSet.version.label('truth_set_version'),
+    TruthSet.reference.label('truth_set_reference'),
+    BenchmarkTool.name.label('benchmark_tool_name'),
+    BenchmarkTool.version.label('benchmark_tool_version'),
+    Variant.type.label('variant_type_detail'),
+    Variant.origin.label('variant_origin'),
+    Variant.size.label('variant_size'),
+    Variant.is_phased,
+    QualityControl.mean_coverage,
+    QualityControl.read_length,
+    QualityControl.mean_read_length,
+    QualityControl.mean_insert_size,
+    Chemistry.name.label('chemistry_name'),
+    Chemistry.version.label('chemistry_version'),
+    OverallResult.variant_type,
+    OverallResult.metric_recall.label('recall'),
+    OverallResult.metric_precision.label('precision'),
+    OverallResult.metric_f1_score.label('f1_score'),
+    OverallResult.truth_total,
+    OverallResult.truth_tp,
+    OverallResult.truth_fn,
+    OverallResult.query_total,
+    OverallResult.query_tp,
+    OverallResult.query_fp
+).select_from(Experiment).outerjoin(
+    SequencingTechnology, Experiment.sequencing_technology_id == SequencingTechnology.id
+).outerjoin(
+    VariantCaller, Experiment.variant_caller_id == VariantCaller.id
+).outerjoin(
+    TruthSet, Experiment.truth_set_id == TruthSet.id
+).outerjoin(
+    BenchmarkTool, Experiment.benchmark_tool_id == BenchmarkTool.id
+).outerjoin(
+    Variant, Experiment.variant_id == Variant.id
+).outerjoin(
+    QualityControl, Experiment.quality_control_metrics_id == QualityControl.id
+).outerjoin(
+    Chemistry, Experiment.chemistry_id == Chemistry.id
+).outerjoin(
+    OverallResult, Experiment.id == OverallResult.experiment_id
+).where(
+    Experiment.id.in_(bindparam('experiment_ids', expanding=True)),
+    OverallResult.variant_type.in_(bindparam('variant_types', expanding=True))
+).order_by(Experiment.id, OverallResult.variant_type)
+
+def _performance_cache_key(experiment_id, variant_types):
+    """Per-experiment cache key for get_experiments_with_performance rows."""
+    return f"experiment:performance:{experiment_id}:{','.join(sorted(map(str, variant_types)))}"
+
+def get_experiments_with_performance(experiment_ids_param, variant_types=['SNP', 'INDEL'], session=None):
     """
     Get performance data combined with metadata for selected experiments.
+    
+    Rows are cached per experiment (only when not inside a caller's session),
+    so re-selecting experiments only queries the ones not seen recently.
     """
     experiment_ids = parse_experiment_ids(experiment_ids_param)
 
@@ -396,122 +569,88 @@ def get_experiments_with_performance(experiment_ids_param, variant_types=['SNP',
         logger.warning("No experiment IDs provided to get_experiments_with_performance")
         return pd.DataFrame()
     
-    try:
-        with get_db_session() as session:
-            query = session.query(
-                Experiment.id.label('experiment_id'),
-                Experiment.name.label('experiment_name'),
-                Experiment.is_public,
-                Experiment.owner_id,
-                SequencingTechnology.technology,
-                SequencingTechnology.platform_name,
-                SequencingTechnology.platform_type,
-                SequencingTechnology.target,
-                VariantCaller.name.label('caller'),
-                VariantCaller.version.label('caller_version'),
-                VariantCaller.type.label('caller_type'),
-                VariantCaller.model.label('caller_model'),
-                TruthSet.name.label('truth_set'),
-                TruthSet.sample.label('truth_set_sample'),
-                TruthSet.version.label('truth_set_version'),
-                TruthSet.reference.label('truth_set_reference'),
-                BenchmarkTool.name.label('benchmark_tool_name'),
-                BenchmarkTool.version.label('benchmark_tool_version'),
-                Variant.type.label('variant_type_detail'),
-                Variant.origin.label('variant_origin'),
-                Variant.size.label('variant_size'),
-                Variant.is_phased,
-                QualityControl.mean_coverage,
-                QualityControl.read_length,
-                QualityControl.mean_read_length,
-                QualityControl.mean_insert_size,
-                Chemistry.name.label('chemistry_name'),
-                Chemistry.version.label('chemistry_version'),
-                OverallResult.variant_type,
-                OverallResult.metric_recall.label('recall'),
-                OverallResult.metric_precision.label('precision'),
-                OverallResult.metric_f1_score.label('f1_score'),
-                OverallResult.truth_total,
-                OverallResult.truth_tp,
-                OverallResult.truth_fn,
-                OverallResult.query_total,
-                OverallResult.query_tp,
-                OverallResult.query_fp
-            ).select_from(Experiment).outerjoin(
-                SequencingTechnology, Experiment.sequencing_technology_id == SequencingTechnology.id
-            ).outerjoin(
-                VariantCaller, Experiment.variant_caller_id == VariantCaller.id
-            ).outerjoin(
-                TruthSet, Experiment.truth_set_id == TruthSet.id
-            ).outerjoin(
-                BenchmarkTool, Experiment.benchmark_tool_id == BenchmarkTool.id
-            ).outerjoin(
-                Variant, Experiment.variant_id == Variant.id
-            ).outerjoin(
-                QualityControl, Experiment.quality_control_metrics_id == QualityControl.id
-            ).outerjoin(
-                Chemistry, Experiment.chemistry_id == Chemistry.id
-            ).outerjoin(
-                OverallResult, Experiment.id == OverallResult.experiment_id
-            ).filter(
-                Experiment.id.in_(experiment_ids),
-                OverallResult.variant_type.in_(variant_types)
-            ).order_by(Experiment.id, OverallResult.variant_type)
-            
-            results = query.all()
-            
-            data = []
-            for row in results:
-                data.append({
-                    'experiment_id': row.experiment_id,
-                    'experiment_name': row.experiment_name,
-                    'is_public': row.is_public,
-                    'owner_id': row.owner_id,
-                    'technology': row.technology.value if row.technology else None,
-                    'platform_name': row.platform_name,
-                    'platform_type': row.platform_type.value if row.platform_type else None,
-                    'target': row.target.value if row.target else None,
-                    'caller': row.caller.value if row.caller else None,
-                    'caller_version': row.caller_version,
-                    'caller_type': row.caller_type.value if row.caller_type else None,
-                    'caller_model': row.caller_model,
-                    'truth_set': row.truth_set.value if row.truth_set else None,
-                    'truth_set_sample': row.truth_set_sample.value if row.truth_set_sample else None,
-                    'truth_set_version': row.truth_set_version,
-                    'truth_set_reference': row.truth_set_reference.value if row.truth_set_reference else None,
-                    'benchmark_tool_name': row.benchmark_tool_name.value if row.benchmark_tool_name else None,
-                    'benchmark_tool_version': row.benchmark_tool_version,
-                    'variant_type_detail': row.variant_type_detail.value if row.variant_type_detail else None,
-                    'variant_origin': row.variant_origin.value if row.variant_origin else None,
-                    'variant_size': row.variant_size.value if row.variant_size else None,
-                    'is_phased': row.is_phased,
-                    'mean_coverage': float(row.mean_coverage) if row.mean_coverage is not None else None,
-                    'read_length': float(row.read_length) if row.read_length is not None else None,
-                    'mean_read_length': float(row.mean_read_length) if row.mean_read_length is not None else None,
-                    'mean_insert_size': float(row.mean_insert_size) if row.mean_insert_size is not None else None,
-                    'chemistry_name': row.chemistry_name,
-                    'chemistry_version': row.chemistry_version,
-                    'variant_type': row.variant_type,
-                    'recall': row.recall,
-                    'precision': row.precision,
-                    'f1_score': row.f1_score,
-                    'truth_total': row.truth_total,
-                    'truth_tp': row.truth_tp,
-                    'truth_fn': row.truth_fn,
-                    'query_total': row.query_total,
-                    'query_tp': row.query_tp,
-                    'query_fp': row.query_fp
-                })
-            
-            return pd.DataFrame(data)
-            
-    except Exception as e:
-        logger.error(f"Error in get_experiments_with_performance: {e}")
-        import traceback
-        traceback.print_exc()
+    use_cache = session is None
+    frames = {}
+    missing = []
+    for experiment_id in set(experiment_ids):
+        cached = cache.get_cached(_performance_cache_key(experiment_id, variant_types)) if use_cache else None
+        if cached is not None:
+            frames[experiment_id] = cached
+        else:
+            missing.append(experiment_id)
+    
+    if missing:
+        with use_session(session) as session:
+            # Fixed statement with expanding bind params: compiled once and
+            # reused from the compiled cache on every call
+            results = session.execute(_PERFORMANCE_STMT, {
+                'experiment_ids': missing,
+                'variant_types': list(variant_types)
+            }).all()
+        
+        if results:
+            # Query labels already match the output columns; build the frame
+            # straight from the row tuples (after the session is released) and
+            # unwrap enums column-wise
+            df = pd.DataFrame.from_records(results, columns=list(results[0]._fields))
+            for col in PERFORMANCE_ENUM_COLUMNS:
+                df[col] = enum_display(df[col], missing=None)
+            
+            for experiment_id, group in df.groupby('experiment_id', sort=False):
+                group = group.reset_index(drop=True)
+                frames[experiment_id] = group
+                if use_cache:
+                    cache.set_cached(_performance_cache_key(experiment_id, variant_types), group)
+    
+    if not frames:
         return pd.DataFrame()
+    
+    # Same order as the query: by experiment id, then variant type
+    ordered = [frames[experiment_id] for experiment_id in sorted(frames)]
+    return ordered[0].copy() if len(ordered) == 1 else pd.concat(ordered, ignore_index=True)
+
+# Output columns of get_stratified_performance_by_regions
+STRATIFIED_COLUMNS = [
+    'experiment_id', 'experiment_name', 'variant_type', 'technology', 'caller',
+    'caller_version', 'platform_name', 'subset', 'filter_type', 'chemistry_name',
+    'recall', 'precision', 'f1_score', 'truth_total', 'truth_tp', 'truth_fn',
+    'query_total', 'query_tp', 'query_fp'
+]
+
+# Stratified results with the experiment fields the plots need, as plain
+# columns (outer joins: results are kept even if metadata is missing).
+# Enum display values are resolved in SQL, so rows need no unwrapping
+_STRATIFIED_STMT = select(
+    BenchmarkResult.experiment_id,
+    Experiment.name.label('experiment_name'),
+    BenchmarkResult.variant_type,
+    enum_value_expr(SequencingTechnology.technology, SeqTechName, 'Unknown').label('technology'),
+    enum_value_expr(VariantCaller.name, CallerName, 'Unknown').label('caller'),
+    VariantCaller.version.label('caller_version'),
+    SequencingTechnology.platform_name,
+    enum_value_expr(BenchmarkResult.subset, RegionType).label('subset'),
+    BenchmarkResult.filter_type,
+    Chemistry.name.label('chemistry_name'),
+    BenchmarkResult.metric_recall.label('recall'),
+    BenchmarkResult.metric_precision.label('precision'),
+    BenchmarkResult.metric_f1_score.label('f1_score'),
+    BenchmarkResult.truth_total,
+    BenchmarkResult.truth_tp,
+    BenchmarkResult.truth_fn,
+    BenchmarkResult.query_total,
+    BenchmarkResult.query_tp,
+    BenchmarkResult.query_fp
+).select_from(BenchmarkResult).outerjoin(
+    Experiment, BenchmarkResult.experiment_id == Experiment.id
+).outerjoin(
+    SequencingTechnology, Experiment.sequencing_technology_id == SequencingTechnology.id
+).outerjoin(
+    VariantCaller, Experiment.variant_caller_id == VariantCaller.id
+).outerjoin(
+    Chemistry, Experiment.chemistry_id == Chemistry.id
+).order_by(BenchmarkResult.id)
 
-def get_stratified_performance_by_regions(experiment_ids_param, variant_types=['SNP', 'INDEL'], regions=None):
+def get_stratified_performance_by_regions(experiment_ids_param, variant_types=['SNP', 'INDEL'], regions=None, session=None):
     """
     Get stratified performance results filtered by specific genomic regions.
     
@@ -521,75 +660,100 @@ def get_stratified_performance_by_regions(experiment_ids_param, variant_types=['
         experiment_ids_param (str/list): JSON string or list of experiment IDs
         variant_types (list): List of variant types to include
         regions (list): List of region names to filter by
+        session (Session): Optional existing session to reuse
         
     Returns:
         pandas.DataFrame: Stratified performance data
     """
     experiment_ids = parse_experiment_ids(experiment_ids_param)
 
-    try:
-        with get_db_session() as session:
-            query = session.query(BenchmarkResult).options(
-                joinedload(BenchmarkResult.experiment).joinedload(Experiment.sequencing_technology),
-                joinedload(BenchmarkResult.experiment).joinedload(Experiment.variant_caller),
-                joinedload(BenchmarkResult.experiment).joinedload(Experiment.chemistry)
-            ).filter(
-                BenchmarkResult.experiment_id.in_(experiment_ids),
-                BenchmarkResult.variant_type.in_(variant_types)
-            )
+    # Nothing selected yet - skip the IN () query entirely
+    if not experiment_ids:
+        return pd.DataFrame()
 
-            # Filter by regions if specified
-            if regions and len(regions) > 0:
-                region_enums = []
-                for region_name in regions:
-                    region_enum = RegionType.from_display_name(region_name) or RegionType.from_string(region_name)
-                    if region_enum:
-                        region_enums.append(region_enum)
-                
-                if region_enums:
-                    query = query.filter(BenchmarkResult.subset.in_(region_enums))
-                else:
-                    logger.warning(f"No valid regions found for: {regions}")
-                    return pd.DataFrame()
-            
-            results = query.all()
-            
-            data = []
-            for result in results:
-                data.append({
-                    'experiment_id': result.experiment_id,
-                    'experiment_name': result.experiment.name if result.experiment else None,
-                    'variant_type': result.variant_type,
-                    'technology': result.experiment.sequencing_technology.technology.value if (result.experiment and result.experiment.sequencing_technology) else 'Unknown',
-                    'caller': result.experiment.variant_caller.name.value if (result.experiment and result.experiment.variant_caller) else 'Unknown',
-                    'caller_version': result.experiment.variant_caller.version if result.experiment.variant_caller else None,
-                    'platform_name': result.experiment.sequencing_technology.platform_name if result.experiment.sequencing_technology else None,
-                    'subset': result.subset.value,
-                    'filter_type': result.filter_type,
-                    'chemistry_name': result.experiment.chemistry.name if (result.experiment and result.experiment.chemistry) else None,
-                    'recall': result.metric_recall,
-                    'precision': result.metric_precision,
-                    'f1_score': result.metric_f1_score,
-                    'truth_total': result.truth_total,
-                    'truth_tp': result.truth_tp,
-                    'truth_fn': result.truth_fn,
-                    'query_total': result.query_total,
-                    'query_tp': result.query_tp,
-                    'query_fp': result.query_fp,
-                })
-            
-            return pd.DataFrame(data)
+    try:
+        query = _STRATIFIED_STMT.where(
+            BenchmarkResult.experiment_id.in_(experiment_ids),
+            BenchmarkResult.variant_type.in_(variant_types)
+        )
+        
+        # Filter by regions if specified
+        if regions and len(regions) > 0:
+            region_enums = []
+            for region_name in regions:
+                region_enum = RegionType.from_display_name(region_name) or RegionType.from_string(region_name)
+                if region_enum:
+                    region_enums.append(region_enum)
+            
+            if region_enums:
+                query = query.where(BenchmarkResult.subset.in_(region_enums))
+            else:
+                logger.warning(f"No valid regions found for: {regions}")
+                return pd.DataFrame()
+        
+        with use_session(session) as session:
+            # Plain column rows streamed in batches; each batch goes straight
+            # into a frame (no ORM objects, no per-row dict)
+            result = session.execute(query, execution_options={'yield_per': 1000})
+            frames = [
+                pd.DataFrame.from_records(rows, columns=STRATIFIED_COLUMNS)
+                for rows in result.partitions()
+            ]
+        
+        if not frames:
+            return pd.DataFrame()
+        
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
             
-    except Exception as e:
-        logger.error(f"Error in get_stratified_performance_by_regions: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error in get_stratified_performance_by_regions")
         return pd.DataFrame()
 
 # ============================================================================
 # TECHNOLOGY AND CALLER FILTERING
 # ============================================================================
 
+def _experiment_ids_cache_key(kind, value, user_id, is_admin):
+    """
+    Cache key for the by-technology/by-caller id lists. Kept under the overview
+    prefix, so uploads, deletes and visibility toggles drop these lists too.
+    """
+    viewer = "admin" if is_admin else (user_id or "anon")
+    return f"{OVERVIEW_CACHE_PREFIX}ids:{kind}:{str(value).strip().upper()}:{viewer}"
+
+def _get_experiment_ids_by(kind, lookup, column, value, user_id, is_admin):
+    """
+    Shared implementation of get_experiments_by_technology / get_experiments_by_caller.
+    
+    Args:
+        kind (str): 'technology' or 'caller' (cache key and log messages)
+        lookup (dict): Filter value -> enum member lookup
+        column: Enum column on the lookup table to filter on
+        value (str): Filter value from the UI
+        user_id, is_admin: Visibility filtering
+        
+    Returns:
+        list: Visible experiment IDs matching the value
+    """
+    # Pure Python validation first - no connection is checked out for bad input
+    member = lookup_enum(lookup, value)
+    if member is None:
+        logger.error(f"Invalid {kind}: {value}")
+        return []
+    
+    cache_key = _experiment_ids_cache_key(kind, value, user_id, is_admin)
+    cached = cache.get_cached(cache_key)
+    if cached is not None:
+        return cached
+    with get_db_session() as session:
+        # ORM relationship join (Experiment -> lookup table), ids as a flat list
+        query = select(Experiment.id).join(column.class_).where(column == member)
+        query = apply_visibility_filter(query, user_id, is_admin)
+        
+        experiment_ids = list(session.scalars(query))
+    cache.set_cached(cache_key, experiment_ids)
+    return experiment_ids
+
 def get_experiments_by_technology(technology, user_id=None, is_admin=False):
     """
     Get experiment IDs matching a specific sequencing technology.
@@ -602,29 +766,9 @@ def get_experiments_by_technology(technology, user_id=None, is_admin=False):
     Returns:
         list: List of visible experiment IDs matching the technology
     """
-    try:
-        with get_db_session() as session:
-            try:
-                tech_enum = SeqTechName(technology.strip().upper())
-            except ValueError:
-                logger.error(f"Invalid technology: {technology}")
-                return []
-            
-            query = session.query(Experiment.id).join(
-                SequencingTechnology
-            ).filter(
-                SequencingTechnology.technology == tech_enum
-            )
-            
-            # Apply visibility filter
-            query = apply_visibility_filter(query, user_id, is_admin)
-            
-            result = query.all()
-            return [row[0] for row in result]
-            
-    except Exception as e:
-        logger.error(f"Error getting experiments by technology: {e}")
-        return []
+    return _get_experiment_ids_by(
+        "technology", TECH_LOOKUP, SequencingTechnology.technology, technology, user_id, is_admin
+    )
 
 def get_experiments_by_caller(caller, user_id=None, is_admin=False):
     """
@@ -638,48 +782,31 @@ def get_experiments_by_caller(caller, user_id=None, is_admin=False):
     Returns:
         list: List of visible experiment IDs matching the caller
     """
-    try:
-        with get_db_session() as session:
-            try:
-                caller_enum = CallerName(caller.strip().upper())
-            except ValueError:
-                logger.error(f"Invalid caller: {caller}")
-                return []
-            
-            query = session.query(Experiment.id).join(
-                VariantCaller
-            ).filter(
-                VariantCaller.name == caller_enum
-            )
-            
-            # Apply visibility filter
-            query = apply_visibility_filter(query, user_id, is_admin)
-            
-            result = query.all()
-            return [row[0] for row in result]
-            
-    except Exception as e:
-        logger.error(f"Error getting experiments by caller: {e}")
-        return []
+    return _get_experiment_ids_by(
+        "caller", CALLER_LOOKUP, VariantCaller.name, caller, user_id, is_admin
+    )
 
 # ============================================================================
 # INDIVIDUAL EXPERIMENT LOOKUPS
 # ============================================================================
 
 def get_technology(experiment_id):
-    """Get sequencing technology name for a specific experiment."""
-    try:
-        with get_db_session() as session:
-            experiment = session.query(Experiment).options(
-                joinedload(Experiment.sequencing_technology)
-            ).filter(Experiment.id == experiment_id).first()
-            
-            if experiment and experiment.sequencing_technology:
-                return experiment.sequencing_technology.technology.value
-            return None
-            
-    except Exception as e:
-        logger.error(f"Error getting technology for experiment {experiment_id}: {e}")
+    """Get sequencing technology name for a specific experiment (cached per experiment)."""
+    cache_key = f"experiment:technology:{experiment_id}"
+    cached = cache.get_cached(cache_key)
+    if cached is not None:
+        return cached
+    with get_db_session() as session:
+        # Primary-key lookup (identity map first, then SELECT ... WHERE id = ?)
+        experiment = session.get(Experiment, experiment_id, options=[
+            joinedload(Experiment.sequencing_technology),
+            raiseload('*')
+        ])
+        
+        if experiment and experiment.sequencing_technology:
+            technology = experiment.sequencing_technology.technology.value
+            cache.set_cached(cache_key, technology)
+            return technology
         return None
 
 def get_caller(experiment_id):
@@ -692,19 +819,88 @@ def get_caller(experiment_id):
     Returns:
         str or None: Caller name (e.g., "DEEPVARIANT", "GATK3") or None if not found
     """
+    # Experiment metadata doesn't change after upload; entries are dropped on delete
+    cache_key = f"experiment:caller:{experiment_id}"
+    cached = cache.get_cached(cache_key)
+    if cached is not None:
+        return cached
+    with get_db_session() as session:
+        experiment = session.get(Experiment, experiment_id, options=[
+            joinedload(Experiment.variant_caller),
+            raiseload('*')
+        ])
+        
+        if experiment and experiment.variant_caller:
+            caller = experiment.variant_caller.name.value
+            cache.set_cached(cache_key, caller)
+            return caller
+        return None
+
+def _get_experiment_values_by_ids(experiment_ids_param, kind, column, onclause):
+    """
+    Shared bulk lookup for get_technologies_by_ids / get_callers_by_ids.
+    
+    Serves cached experiment:<kind>:<id> entries first and fetches the rest
+    with a single IN (...) query joined to the lookup table.
+    """
+    values = {}
+    missing = []
+    for experiment_id in set(parse_experiment_ids(experiment_ids_param)):
+        cached = cache.get_cached(f"experiment:{kind}:{experiment_id}")
+        if cached is not None:
+            values[experiment_id] = cached
+        else:
+            missing.append(experiment_id)
+    
+    if not missing:
+        return values
+    
     try:
+        query = select(Experiment.id, column).join(
+            column.class_, onclause
+        ).where(Experiment.id.in_(missing))
         with get_db_session() as session:
-            experiment = session.query(Experiment).options(
-                joinedload(Experiment.variant_caller)
-            ).filter(Experiment.id == experiment_id).first()
-            
-            if experiment and experiment.variant_caller:
-                return experiment.variant_caller.name.value
-            return None
-            
+            rows = session.execute(query).all()
+        
+        for experiment_id, member in rows:
+            if member is not None:
+                cache.set_cached(f"experiment:{kind}:{experiment_id}", member.value)
+                values[experiment_id] = member.value
+        return values
+    
     except Exception as e:
-        logger.error(f"Error getting caller for experiment {experiment_id}: {e}")
-        return None
+        logger.error(f"Error getting {kind} for experiments {missing}: {e}")
+        return values
+
+def get_technologies_by_ids(experiment_ids_param):
+    """
+    Get sequencing technology names for several experiments in one query.
+    
+    Args:
+        experiment_ids_param (str/list): JSON string or list of experiment IDs
+        
+    Returns:
+        dict: {experiment_id: technology} for experiments that have one
+    """
+    return _get_experiment_values_by_ids(
+        experiment_ids_param, "technology", SequencingTechnology.technology,
+        Experiment.sequencing_technology_id == SequencingTechnology.id
+    )
+
+def get_callers_by_ids(experiment_ids_param):
+    """
+    Get variant caller names for several experiments in one query.
+    
+    Args:
+        experiment_ids_param (str/list): JSON string or list of experiment IDs
+        
+    Returns:
+        dict: {experiment_id: caller} for experiments that have one
+    """
+    return _get_experiment_values_by_ids(
+        experiment_ids_param, "caller", VariantCaller.name,
+        Experiment.variant_caller_id == VariantCaller.id
+    )
 
 def get_experiment_owner(experiment_id):
     """
@@ -719,7 +915,8 @@ def get_experiment_owner(experiment_id):
     try:
         with get_db_session() as session:
             experiment = session.query(Experiment).options(
-                joinedload(Experiment.owner)
+                joinedload(Experiment.owner),
+                raiseload('*')
             ).filter(Experiment.id == experiment_id).first()
             
             if experiment:
@@ -777,15 +974,49 @@ def can_user_access_experiment(experiment_id, user_id=None, is_admin=False):
 # DROPDOWN OPTIONS
 # ============================================================================
 
-def get_distinct_technologies():
-    """Get list of distinct technology names in database."""
+# (option key, enum class, column) for the dropdown lists filled by get_filter_options()
+FILTER_OPTION_COLUMNS = [
+    ('technologies', SeqTechName, SequencingTechnology.technology),
+    ('callers', CallerName, VariantCaller.name),
+    ('truth_sets', TruthSetName, TruthSet.name),
+]
+
+def get_filter_options():
+    """
+    Get technologies, callers and truth sets present in the database.
+    
+    All three lists come from one UNION ALL query and are cached together.
+    
+    Returns:
+        dict: {'technologies': [...], 'callers': [...], 'truth_sets': [...]} as display values
+    """
+    cached = cache.get_cached("meta:filter_options")
+    if cached is not None:
+        return cached
     try:
+        # Enum columns hold member names; cast so every branch returns plain strings
+        query = union_all(*[
+            select(literal(key).label('category'), cast(column, String).label('name')).distinct()
+            for key, _, column in FILTER_OPTION_COLUMNS
+        ])
         with get_db_session() as session:
-            result = session.query(SequencingTechnology.technology).distinct().all()
-            return [row[0].value for row in result if row[0]]
+            rows = session.execute(query).all()
+        
+        enum_classes = {key: enum_cls for key, enum_cls, _ in FILTER_OPTION_COLUMNS}
+        options = {key: [] for key in enum_classes}
+        for category, name in rows:
+            if name:
+                options[category].append(enum_classes[category][name].value)
+        
+        cache.set_cached("meta:filter_options", options)
+        return options
     except Exception as e:
-        logger.error(f"Error getting distinct technologies: {e}")
-        return []
+        logger.error(f"Error getting filter options: {e}")
+        return {key: [] for key, _, _ in FILTER_OPTION_COLUMNS}
+
+def get_distinct_technologies():
+    """Get list of distinct technology names in database."""
+    return list(get_filter_options()['technologies'])
 
 def get_distinct_callers():
     """
@@ -794,34 +1025,31 @@ def get_distinct_callers():
     Returns:
         list: Sorted list of caller names (e.g., ["CLAIR3", "DEEPVARIANT", "GATK3"])
     """
-    try:
-        with get_db_session() as session:
-            result = session.query(VariantCaller.name).distinct().all()
-            return [row[0].value for row in result if row[0]]
-    except Exception as e:
-        logger.error(f"Error getting distinct callers: {e}")
-        return []
+    return list(get_filter_options()['callers'])
 
 def get_distinct_truth_sets():
     """Get list of distinct truth set names in database."""
-    try:
-        with get_db_session() as session:
-            result = session.query(TruthSet.name).distinct().all()
-            return [row[0].value for row in result if row[0]]
-    except Exception as e:
-        logger.error(f"Error getting distinct truth sets: {e}")
-        return []
+    return list(get_filter_options()['truth_sets'])
 
 def get_platforms_by_technology(technology):
     """Get platforms available for a specific technology."""
+    cache_key = f"meta:platforms:{technology.upper() if technology else technology}"
+    cached = cache.get_cached(cache_key)
+    if cached is not None:
+        return cached
+    tech_enum = lookup_enum(TECH_LOOKUP, technology)
+    if tech_enum is None:
+        logger.error(f"Invalid technology: {technology}")
+        return []
     try:
         with get_db_session() as session:
-            tech_enum = SeqTechName(technology.upper())
             result = session.query(SequencingTechnology.platform_name).filter(
                 SequencingTechnology.technology == tech_enum,
                 SequencingTechnology.platform_name.isnot(None)
             ).distinct().all()
-            return [row[0] for row in result if row[0]]
+            platforms = [row[0] for row in result if row[0]]
+        cache.set_cached(cache_key, platforms)
+        return platforms
     except Exception as e:
         logger.error(f"Error getting platforms for {technology}: {e}")
         return []
@@ -910,12 +1138,27 @@ def get_caller_hierarchy(user_id=None, is_admin=False):
 # USER'S EXPERIMENTS
 # ============================================================================
 
-def get_user_experiments(user_id):
+# Built once at import; SQLAlchemy reuses the compiled SQL on every call
+_USER_EXPERIMENTS_STMT = select(
+    Experiment.id,
+    Experiment.name,
+    SequencingTechnology.technology,
+    VariantCaller.name.label('caller'),
+    Experiment.is_public,
+    Experiment.created_at
+).outerjoin(
+    SequencingTechnology, Experiment.sequencing_technology_id == SequencingTechnology.id
+).outerjoin(
+    VariantCaller, Experiment.variant_caller_id == VariantCaller.id
+).where(Experiment.owner_id == bindparam('user_id'))
+
+def get_user_experiments(user_id, session=None):
     """
     Get all experiments owned by a specific user.
     
     Args:
         user_id: User's database ID
+        session: Optional existing session to reuse
         
     Returns:
         pandas.DataFrame: User's experiments
@@ -924,26 +1167,19 @@ def get_user_experiments(user_id):
         return pd.DataFrame()
     
     try:
-        with get_db_session() as session:
-            query = session.query(Experiment).options(
-                joinedload(Experiment.sequencing_technology),
-                joinedload(Experiment.variant_caller)
-            ).filter(Experiment.owner_id == user_id)
-            
-            experiments = query.all()
-            
-            data = []
-            for exp in experiments:
-                data.append({
-                    'id': exp.id,
-                    'name': exp.name,
-                    'technology': exp.sequencing_technology.technology.value if exp.sequencing_technology else "N/A",
-                    'caller': exp.variant_caller.name.value if exp.variant_caller else "N/A",
-                    'is_public': exp.is_public,
-                    'created_at': exp.created_at.strftime('%Y-%m-%d') if exp.created_at else "N/A"
-                })
-            
-            return pd.DataFrame(data)
+        with use_session(session) as session:
+            rows = session.execute(_USER_EXPERIMENTS_STMT, {'user_id': user_id}).all()
+        
+        if not rows:
+            return pd.DataFrame()
+        
+        # Row tuples straight into a frame, then format column-wise
+        df = pd.DataFrame.from_records(rows, columns=list(rows[0]._fields))
+        df['technology'] = enum_display(df['technology'])
+        df['caller'] = enum_display(df['caller'])
+        df['created_at'] = date_display(df['created_at'])
+        
+        return df
             
     except Exception as e:
         logger.error(f"Error getting user experiments: {e}")
@@ -1016,30 +1252,40 @@ def get_all_private_experiments():
     """
     try:
         with get_db_session() as session:
-            query = session.query(Experiment).options(
-                joinedload(Experiment.sequencing_technology),
-                joinedload(Experiment.variant_caller),
-                joinedload(Experiment.owner)
+            # Plain column rows - no Experiment/User objects are hydrated
+            query = session.query(
+                Experiment.id,
+                Experiment.name,
+                Experiment.created_at,
+                User.email.label('owner_email'),
+                SequencingTechnology.technology,
+                VariantCaller.name.label('caller')
+            ).select_from(Experiment).outerjoin(
+                User, Experiment.owner_id == User.id
+            ).outerjoin(
+                SequencingTechnology, Experiment.sequencing_technology_id == SequencingTechnology.id
+            ).outerjoin(
+                VariantCaller, Experiment.variant_caller_id == VariantCaller.id
             ).filter(
                 Experiment.is_public == False,
                 Experiment.owner_id.isnot(None)
             ).order_by(Experiment.created_at.desc())
             
-            experiments = query.all()
-            
-            data = []
-            for exp in experiments:
-                data.append({
-                    'id': exp.id,
-                    'name': exp.name,
-                    'owner_username': exp.owner.email if exp.owner else "Unknown",
-                    'owner_email': exp.owner.email if exp.owner else "N/A",
-                    'technology': exp.sequencing_technology.technology.value if exp.sequencing_technology else "N/A",
-                    'caller': exp.variant_caller.name.value if exp.variant_caller else "N/A",
-                    'created_at': exp.created_at.strftime('%Y-%m-%d') if exp.created_at else "N/A"
-                })
-            
-            return pd.DataFrame(data)
+            rows = query.all()
+        
+        if not rows:
+            return pd.DataFrame()
+        
+        # Row tuples straight into a frame, then format column-wise
+        df = pd.DataFrame.from_records(rows, columns=list(rows[0]._fields))
+        has_owner = df['owner_email'].notna() & (df['owner_email'] != "")
+        df['owner_username'] = df['owner_email'].where(has_owner, "Unknown")
+        df['owner_email'] = df['owner_email'].where(has_owner, "N/A")
+        df['technology'] = enum_display(df['technology'])
+        df['caller'] = enum_display(df['caller'])
+        df['created_at'] = date_display(df['created_at'])
+        
+        return df[['id', 'name', 'owner_username', 'owner_email', 'technology', 'caller', 'created_at']]
             
     except Exception as e:
         logger.error(f"Error getting private experiments: {e}")
@@ -1059,30 +1305,42 @@ def toggle_experiment_visibility(experiment_id, make_public=True):
     """
     try:
         with get_db_session() as session:
-            experiment = session.query(Experiment).filter(
-                Experiment.id == experiment_id
-            ).first()
-            
-            if not experiment:
+            # Single atomic UPDATE; RETURNING gives the name and doubles as the not-found check
+            experiment_name = session.execute(
+                update(Experiment)
+                .where(Experiment.id == experiment_id)
+                .values(is_public=make_public)
+                .returning(Experiment.name)
+            ).scalar_one_or_none()
+            
+            if experiment_name is None:
                 return {
                     "success": False,
                     "error": f"Experiment {experiment_id} not found"
                 }
             
-            old_status = "public" if experiment.is_public else "private"
-            experiment.is_public = make_public
-            new_status = "public" if make_public else "private"
-            
-            session.commit()
-            
-            logger.info(f"Experiment {experiment_id} visibility changed: {old_status} -> {new_status}")
-            
-            return {
-                "success": True,
-                "message": f"Experiment '{experiment.name}' is now {new_status}",
-                "experiment_id": experiment_id,
-                "is_public": make_public
-            }
+            # Keep the denormalized overview row in step
+            session.execute(
+                update(ExperimentFlat)
+                .where(ExperimentFlat.id == experiment_id)
+                .values(is_public=make_public)
+            )
+        
+        new_status = "public" if make_public else "private"
+        
+        logger.info(f"Experiment {experiment_id} visibility changed to {new_status}")
+        
+        # Visibility change is invisible to the overview cache probe - drop it,
+        # along with the cached performance rows (they carry is_public)
+        cache.invalidate_prefix(OVERVIEW_CACHE_PREFIX)
+        cache.invalidate_prefix(f"experiment:performance:{experiment_id}:")
+        
+        return {
+            "success": True,
+            "message": f"Experiment '{experiment_name}' is now {new_status}",
+            "experiment_id": experiment_id,
+            "is_public": make_public
+        }
             
     except Exception as e:
         logger.error(f"Error toggling visibility for experiment {experiment_id}: {e}")
@@ -1100,35 +1358,33 @@ def get_all_users_with_stats():
     """
     try:
         with get_db_session() as session:
-            from sqlalchemy import func
-            
             # Subquery for experiment counts per user
-            exp_counts = session.query(
+            exp_counts = select(
                 Experiment.owner_id,
                 func.count(Experiment.id).label('upload_count')
             ).group_by(Experiment.owner_id).subquery()
             
-            users = session.query(User).all()
-            
-            data = []
-            for user in users:
-                # Get upload count for this user
-                count_result = session.query(exp_counts.c.upload_count).filter(
-                    exp_counts.c.owner_id == user.id
-                ).scalar() or 0
-                
-                data.append({
-                    'id': user.id,
-                    'username': user.username,
-                    'email': user.email or "N/A",
-                    'full_name': user.full_name or "N/A",
-                    'is_admin': user.is_admin,
-                    'upload_count': count_result,
-                    'created_at': user.created_at.strftime('%Y-%m-%d') if user.created_at else "N/A",
-                    'last_login': user.last_login.strftime('%Y-%m-%d %H:%M') if user.last_login else "Never"
-                })
-            
-            return pd.DataFrame(data)
+            # One query: counts joined per user, "N/A"/0 defaults applied in SQL
+            query = select(
+                User.id,
+                User.username,
+                func.coalesce(func.nullif(User.email, ''), 'N/A').label('email'),
+                func.coalesce(func.nullif(User.full_name, ''), 'N/A').label('full_name'),
+                User.is_admin,
+                func.coalesce(exp_counts.c.upload_count, 0).label('upload_count'),
+                User.created_at,
+                User.last_login
+            ).outerjoin(exp_counts, exp_counts.c.owner_id == User.id).order_by(User.id)
+            
+            rows = session.execute(query).all()
+        
+        if not rows:
+            return pd.DataFrame()
+        
+        df = pd.DataFrame.from_records(rows, columns=list(rows[0]._fields))
+        df['created_at'] = date_display(df['created_at'])
+        df['last_login'] = date_display(df['last_login'], fmt='%Y-%m-%d %H:%M', missing="Never")
+        return df
             
     except Exception as e:
         logger.error(f"Error getting users with stats: {e}")
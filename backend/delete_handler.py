@@ -20,8 +20,10 @@ import os
 import shutil
 import logging
 from datetime import datetime
+from sqlalchemy import delete
 from config import DATA_FOLDER
 from database import get_db_session
+import cache
 from models import Experiment, BenchmarkResult, OverallResult
 
 logger = logging.getLogger(__name__)
@@ -154,22 +156,29 @@ def _delete_from_database(experiment_id, session):
     """
     Delete experiment and related records from database.
     Order: BenchmarkResult -> OverallResult -> Experiment (foreign key constraints)
-    
+
+    Uses set-based Core DELETEs (one statement per table, no ORM loading).
+    Result tables declare ON DELETE CASCADE, but databases created before
+    that still need the explicit child deletes.
+
     Returns:
         dict: Deletion counts
     """
-    benchmark_count = session.query(BenchmarkResult).filter(
-        BenchmarkResult.experiment_id == experiment_id
-    ).delete()
-    
-    overall_count = session.query(OverallResult).filter(
-        OverallResult.experiment_id == experiment_id
-    ).delete()
-    
-    exp_count = session.query(Experiment).filter(
-        Experiment.id == experiment_id
-    ).delete()
-    
+    benchmark_count = session.execute(
+        delete(BenchmarkResult).where(BenchmarkResult.experiment_id == experiment_id),
+        execution_options={"synchronize_session": False}
+    ).rowcount
+
+    overall_count = session.execute(
+        delete(OverallResult).where(OverallResult.experiment_id == experiment_id),
+        execution_options={"synchronize_session": False}
+    ).rowcount
+
+    exp_count = session.execute(
+        delete(Experiment).where(Experiment.id == experiment_id),
+        execution_options={"synchronize_session": False}
+    ).rowcount
+
     return {
         "benchmark_results": benchmark_count,
         "overall_results": overall_count,
@@ -238,6 +247,11 @@ def delete_experiment(experiment_id, user_id=None, username=None, is_admin=False
             logger.info(f"DB deletion complete - {counts['benchmark_results']} benchmark results, "
                        f"{counts['overall_results']} overall results")
         
+        # Cached overview tables and per-experiment lookups may still hold the
+        # deleted experiment (SQLite can reuse its id)
+        cache.invalidate_prefix("overview:")
+        cache.invalidate_prefix("experiment:")
+        
         # Step 4: Remove from CSV backup (outside DB transaction)
         # This also archives metadata to 000_deleted.csv
         try:
@@ -258,7 +272,5 @@ def delete_experiment(experiment_id, user_id=None, username=None, is_admin=False
         }
         
     except Exception as e:
-        logger.error(f"Delete failed for experiment {experiment_id}: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"Delete failed for experiment {experiment_id}")
         return {"success": False, "error": f"Delete failed: {str(e)}"}
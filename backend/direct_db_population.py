@@ -8,10 +8,12 @@ Bypasses CSV file - creates database entries directly from upload form data.
 
 import logging
 from datetime import datetime
-from sqlalchemy import func
+from sqlalchemy import func, insert, select
 from models import *
 from utils import clean_value, safe_float
 from enum_mappings import ENUM_MAPPINGS, map_enum, map_boolean
+import cache
+from experiment_flat import refresh_experiment_flat
 
 logger = logging.getLogger(__name__)  
 
@@ -34,7 +36,7 @@ def normalize_for_comparison(value):
 
 def get_or_create_record(session, model_class, filter_fields, all_fields=None):
     """
-    Get existing record or create new one.
+    Get existing record ID or insert a new record and return its ID.
     <<<<< CASE INSENSITIVE for string fields>>>>>
 
     Args:
@@ -44,34 +46,34 @@ def get_or_create_record(session, model_class, filter_fields, all_fields=None):
         all_fields: All fields for new record (defaults to filter_fields)
     
     Returns:
-        Database record (existing or new)
+        int: ID of the existing or newly inserted record
     """
     if all_fields is None:
         all_fields = filter_fields
     
-    query = session.query(model_class)
+    query = select(model_class.id)
     for key, value in filter_fields.items():
         column = getattr(model_class, key)
         if isinstance(value, str) and value:
             # Compare normalized (no spaces, lowercase)
             # But this requires stored values to also be compared normalized
-            query = query.filter(
+            query = query.where(
                 func.replace(func.lower(column), ' ', '') == normalize_for_comparison(value)
             )
         else:
-            query = query.filter(column == value)
+            query = query.where(column == value)
     
-    existing = query.first()
-    if existing:
-        return existing
+    existing_id = session.scalars(query.limit(1)).first()
+    if existing_id is not None:
+        return existing_id
     
-    new_record = model_class(**all_fields)
-    session.add(new_record)
-    session.flush()
-    return new_record
+    # INSERT ... RETURNING hands back the new ID without an ORM flush
+    return session.scalar(
+        insert(model_class).values(**all_fields).returning(model_class.id)
+    )
 
 def create_sequencing_tech(session, metadata):
-    """Create SequencingTechnology record from metadata dict"""
+    """Get or create SequencingTechnology record from metadata dict, returning its ID"""
     tech_enum = map_enum('technology', metadata.get('technology'))
     target_enum = map_enum('target', metadata.get('target', 'wgs'))
     platform_type_enum = map_enum('platform_type', metadata.get('platform_type'))
@@ -94,7 +96,7 @@ def create_sequencing_tech(session, metadata):
     return get_or_create_record(session, SequencingTechnology, filter_fields, all_fields)
 
 def create_variant_caller(session, metadata):
-    """Create VariantCaller record from metadata dict"""
+    """Get or create VariantCaller record from metadata dict, returning its ID"""
     name_enum = map_enum('caller_name', metadata.get('caller_name'))
     type_enum = map_enum('caller_type', metadata.get('caller_type'))
     
@@ -115,7 +117,7 @@ def create_variant_caller(session, metadata):
     return get_or_create_record(session, VariantCaller, filter_fields, all_fields)
 
 def create_aligner(session, metadata):
-    """Create Aligner record from metadata dict"""
+    """Get or create Aligner record from metadata dict, returning its ID"""
     aligner_name = metadata.get('aligner_name')
     
     if not aligner_name or str(aligner_name).strip() == '':
@@ -129,7 +131,7 @@ def create_aligner(session, metadata):
     return get_or_create_record(session, Aligner, filter_fields)
 
 def create_truth_set(session, metadata):
-    """Create TruthSet record from metadata dict"""
+    """Get or create TruthSet record from metadata dict, returning its ID"""
     name_enum = map_enum('truth_set_name', metadata.get('truth_set_name'))
     reference_enum = map_enum('truth_set_reference', metadata.get('truth_set_reference'))
     sample_enum = map_enum('truth_set_sample', metadata.get('truth_set_sample', 'hg002'))
@@ -147,7 +149,7 @@ def create_truth_set(session, metadata):
     return get_or_create_record(session, TruthSet, filter_fields)
 
 def create_benchmark_tool(session, metadata):
-    """Create BenchmarkTool record from metadata dict"""
+    """Get or create BenchmarkTool record from metadata dict, returning its ID"""
     tool_enum = map_enum('benchmark_tool_name', metadata.get('benchmark_tool_name', 'hap.py'))
     
     if not tool_enum:
@@ -161,7 +163,7 @@ def create_benchmark_tool(session, metadata):
     return get_or_create_record(session, BenchmarkTool, filter_fields)
 
 def create_variant(session, metadata):
-    """Create Variant record from metadata dict"""
+    """Get or create Variant record from metadata dict, returning its ID"""
     type_enum = map_enum('variant_type', metadata.get('variant_type', 'snp+indel'))
     size_enum = map_enum('variant_size', metadata.get('variant_size'))
     origin_enum = map_enum('variant_origin', metadata.get('variant_origin'))
@@ -177,7 +179,7 @@ def create_variant(session, metadata):
     return get_or_create_record(session, Variant, filter_fields)
 
 def create_chemistry(session, metadata):
-    """Create Chemistry record from metadata dict"""
+    """Get or create Chemistry record from metadata dict, returning its ID"""
     chemistry_name = metadata.get('chemistry_name')
     
     if not chemistry_name or str(chemistry_name).strip() == '':
@@ -195,7 +197,7 @@ def create_chemistry(session, metadata):
     return get_or_create_record(session, Chemistry, filter_fields)
 
 def create_quality_control(session, metadata):
-    """Create QualityControl record from metadata dict"""
+    """Get or create QualityControl record from metadata dict, returning its ID"""
     all_fields = {
         'mean_coverage': safe_float(metadata.get('mean_coverage')),
         'read_length': safe_float(metadata.get('read_length')),
@@ -219,7 +221,8 @@ def create_experiment_direct(metadata, session=None):
     
     Args:
         metadata: Dictionary with experiment metadata from upload form
-        session: SQLAlchemy session (if None, creates own session)
+        session: SQLAlchemy session (if None, creates own session and commits;
+            otherwise the caller commits and drops the "meta:"/"overview:" cache)
     
     Returns:
         dict: {"success": bool, "experiment_id": int, "message": str}
@@ -234,15 +237,15 @@ def create_experiment_direct(metadata, session=None):
     try:
         logger.info(f"Creating experiment: {metadata.get('exp_name', 'Unknown')}")
         
-        # Create related records
-        seq_tech = create_sequencing_tech(session, metadata)
-        caller = create_variant_caller(session, metadata)
-        aligner = create_aligner(session, metadata)
-        truth_set = create_truth_set(session, metadata)
-        benchmark_tool = create_benchmark_tool(session, metadata)
-        variant = create_variant(session, metadata)
-        chemistry = create_chemistry(session, metadata)
-        qc = create_quality_control(session, metadata)
+        # Get or create related records
+        seq_tech_id = create_sequencing_tech(session, metadata)
+        caller_id = create_variant_caller(session, metadata)
+        aligner_id = create_aligner(session, metadata)
+        truth_set_id = create_truth_set(session, metadata)
+        benchmark_tool_id = create_benchmark_tool(session, metadata)
+        variant_id = create_variant(session, metadata)
+        chemistry_id = create_chemistry(session, metadata)
+        qc_id = create_quality_control(session, metadata)
         
         # Parse created_at timestamp
         created_at = metadata.get('created_at')
@@ -262,34 +265,40 @@ def create_experiment_direct(metadata, session=None):
             owner_id = metadata.get('owner_id') if isinstance(metadata.get('owner_id'), int) else None
             created_by = metadata.get('owner_username')
         
-        # Create experiment - ID auto-generated by database
-        experiment = Experiment(
-            name=metadata.get('exp_name', 'Unnamed Experiment'),
-            description=metadata.get('description', f"Experiment {metadata.get('exp_name', '')}"),
-            created_at=created_at,
-            owner_id=owner_id,
-            is_public=is_public,
-            created_by_username=created_by,
-            sequencing_technology_id=seq_tech.id if seq_tech else None,
-            variant_caller_id=caller.id if caller else None,
-            aligner_id=aligner.id if aligner else None,
-            truth_set_id=truth_set.id if truth_set else None,
-            benchmark_tool_id=benchmark_tool.id if benchmark_tool else None,
-            variant_id=variant.id if variant else None,
-            chemistry_id=chemistry.id if chemistry else None,
-            quality_control_metrics_id=qc.id if qc else None
+        # Create experiment - ID auto-generated by database and returned by the INSERT
+        exp_name = metadata.get('exp_name', 'Unnamed Experiment')
+        experiment_id = session.scalar(
+            insert(Experiment).values(
+                name=exp_name,
+                description=metadata.get('description', f"Experiment {metadata.get('exp_name', '')}"),
+                created_at=created_at,
+                owner_id=owner_id,
+                is_public=is_public,
+                created_by_username=created_by,
+                sequencing_technology_id=seq_tech_id,
+                variant_caller_id=caller_id,
+                aligner_id=aligner_id,
+                truth_set_id=truth_set_id,
+                benchmark_tool_id=benchmark_tool_id,
+                variant_id=variant_id,
+                chemistry_id=chemistry_id,
+                quality_control_metrics_id=qc_id
+            ).returning(Experiment.id)
         )
         
-        session.add(experiment)
-        session.flush()  # Get ID without committing
-        
-        experiment_id = experiment.id
+        # Denormalized overview row, in the same transaction as the experiment
+        refresh_experiment_flat(session, [experiment_id])
         
         # Only commit if we own the session
         if owns_session:
             session.commit()
+            
+            # New lookup rows may have been added - drop cached filter options and overviews.
+            # Callers passing their own session invalidate after their commit
+            cache.invalidate_prefix("meta:")
+            cache.invalidate_prefix("overview:")
         
-        logger.info(f"Created experiment ID {experiment_id}: {experiment.name}")
+        logger.info(f"Created experiment ID {experiment_id}: {exp_name}")
         
         return {
             "success": True,
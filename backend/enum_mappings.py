@@ -92,6 +92,13 @@ ENUM_MAPPINGS = {
     'benchmark_tool_name': _build_mapping(BenchmarkToolName, ALIASES.get('benchmark_tool_name')),
 }
 
+# Flat (field_name, lowercase value) -> enum lookup used by map_enum
+_ENUM_LOOKUP = {
+    (field_name, key): member
+    for field_name, mapping in ENUM_MAPPINGS.items()
+    for key, member in mapping.items()
+}
+
 # ============================================================================
 # VALID LISTS - Used by upload_handler.py for validation
 # ============================================================================
@@ -124,15 +131,11 @@ def map_enum(field_name, value):
     Returns:
         Enum value or None if not found
     """
-    if not value or value == '' or value is None:
-        return None
-    
-    value_clean = str(value).strip().lower()
-    
-    if field_name not in ENUM_MAPPINGS:
+    if not value:
         return None
     
-    return ENUM_MAPPINGS[field_name].get(value_clean)
+    # Unknown field names simply miss in the flat lookup
+    return _ENUM_LOOKUP.get((field_name, str(value).strip().lower()))
 
 def map_boolean(value):
     """Convert string/bool to boolean."""
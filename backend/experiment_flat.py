@@ -0,0 +1,101 @@
+# ============================================================================
+# experiment_flat.py
+# ============================================================================
+"""
+Denormalized experiment table for SNV Benchmarking Dashboard.
+
+Main components:
+- Source query joining experiments with their lookup tables
+- Refresh of experiment_flat rows (single experiments or full rebuild)
+
+experiment_flat stores the overview columns with enum display values already
+resolved, so the overview table is read from one table without joins.
+Rows are refreshed by the code paths that write experiments; deleted
+experiments drop out through ON DELETE CASCADE.
+"""
+
+import logging
+from sqlalchemy import select, delete, insert
+from database import use_session
+from models import (
+    Experiment, ExperimentFlat, SequencingTechnology, VariantCaller,
+    TruthSet, Chemistry
+)
+
+logger = logging.getLogger(__name__)
+
+# Enum columns stored as their display value
+ENUM_COLUMNS = ('technology', 'caller', 'truth_set', 'sample')
+
+# ============================================================================
+# SOURCE QUERY
+# ============================================================================
+
+def _flat_source_query():
+    """Select experiment_flat columns from the normalized tables."""
+    return select(
+        Experiment.id,
+        Experiment.name,
+        SequencingTechnology.technology,
+        SequencingTechnology.platform_name,
+        VariantCaller.name.label('caller'),
+        VariantCaller.version.label('caller_version'),
+        Chemistry.name.label('chemistry'),
+        TruthSet.name.label('truth_set'),
+        TruthSet.sample,
+        Experiment.is_public,
+        Experiment.owner_id,
+        Experiment.created_at
+    ).select_from(Experiment).outerjoin(
+        SequencingTechnology, Experiment.sequencing_technology_id == SequencingTechnology.id
+    ).outerjoin(
+        VariantCaller, Experiment.variant_caller_id == VariantCaller.id
+    ).outerjoin(
+        TruthSet, Experiment.truth_set_id == TruthSet.id
+    ).outerjoin(
+        Chemistry, Experiment.chemistry_id == Chemistry.id
+    )
+
+# ============================================================================
+# REFRESH
+# ============================================================================
+
+def refresh_experiment_flat(session=None, experiment_ids=None):
+    """
+    Rebuild experiment_flat rows from the normalized tables.
+
+    Args:
+        session (Session): Optional existing session; rows are written in its transaction
+        experiment_ids (list): Experiments to refresh (None = rebuild the whole table)
+
+    Returns:
+        int: Number of rows written
+    """
+    query = _flat_source_query()
+    clear_stmt = delete(ExperimentFlat)
+    if experiment_ids is not None:
+        if not experiment_ids:
+            return 0
+        query = query.where(Experiment.id.in_(experiment_ids))
+        clear_stmt = clear_stmt.where(ExperimentFlat.id.in_(experiment_ids))
+
+    with use_session(session) as session:
+        records = [dict(row) for row in session.execute(query).mappings()]
+        for record in records:
+            for col in ENUM_COLUMNS:
+                if record[col] is not None:
+                    record[col] = record[col].value
+
+        session.execute(clear_stmt)
+        if records:
+            session.execute(insert(ExperimentFlat), records)
+
+    return len(records)
+
+def rebuild_experiment_flat():
+    """Full rebuild at startup, so rows written outside the app (scripts, manual edits) are picked up."""
+    try:
+        count = refresh_experiment_flat()
+        logger.info(f"Rebuilt experiment_flat ({count} experiments)")
+    except Exception as e:
+        logger.warning(f"Could not rebuild experiment_flat: {e}")
@@ -14,12 +14,67 @@ Main components:
 import os
 import logging
 import pandas as pd
+from sqlalchemy import insert
 from models import RegionType, BenchmarkResult, OverallResult
 from config import get_data_file_path
-from utils import safe_float, safe_int
+from utils import safe_float_series, safe_int_series
 
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# COLUMN MAPPING (model field -> hap.py column)
+# ============================================================================
+
+FLOAT_FIELDS = {
+    # Performance metrics
+    'metric_recall': 'METRIC.Recall',
+    'metric_precision': 'METRIC.Precision',
+    'metric_f1_score': 'METRIC.F1_Score',
+    
+    # Subset information
+    'subset_size': 'Subset.Size',
+    'subset_is_conf_size': 'Subset.IS_CONF.Size',
+}
+
+INT_FIELDS = {
+    # Truth set totals / true positives / false negatives
+    'truth_total': 'TRUTH.TOTAL',
+    'truth_total_het': 'TRUTH.TOTAL.het',
+    'truth_total_homalt': 'TRUTH.TOTAL.homalt',
+    'truth_tp': 'TRUTH.TP',
+    'truth_tp_het': 'TRUTH.TP.het',
+    'truth_tp_homalt': 'TRUTH.TP.homalt',
+    'truth_fn': 'TRUTH.FN',
+    'truth_fn_het': 'TRUTH.FN.het',
+    'truth_fn_homalt': 'TRUTH.FN.homalt',
+    
+    # Query totals / true positives / false positives / unknown
+    'query_total': 'QUERY.TOTAL',
+    'query_total_het': 'QUERY.TOTAL.het',
+    'query_total_homalt': 'QUERY.TOTAL.homalt',
+    'query_tp': 'QUERY.TP',
+    'query_tp_het': 'QUERY.TP.het',
+    'query_tp_homalt': 'QUERY.TP.homalt',
+    'query_fp': 'QUERY.FP',
+    'query_fp_het': 'QUERY.FP.het',
+    'query_fp_homalt': 'QUERY.FP.homalt',
+    'query_unk': 'QUERY.UNK',
+    'query_unk_het': 'QUERY.UNK.het',
+    'query_unk_homalt': 'QUERY.UNK.homalt',
+}
+
+# Subset of metrics copied into OverallResult
+OVERALL_FIELDS = [
+    'metric_recall', 'metric_precision', 'metric_f1_score',
+    'truth_total', 'truth_tp', 'truth_fn',
+    'query_total', 'query_tp', 'query_fp'
+]
+
+# Only these hap.py columns are read; identifier columns load as categoricals
+HAPPY_ID_COLS = ['Type', 'Subtype', 'Subset', 'Filter']
+HAPPY_COLS = set(HAPPY_ID_COLS) | set(FLOAT_FIELDS.values()) | set(INT_FIELDS.values())
+HAPPY_DTYPES = {col: 'category' for col in HAPPY_ID_COLS}
+
 # ============================================================================
 # FILE VALIDATION
 # ============================================================================
@@ -42,9 +97,9 @@ def validate_happy_file(file_path):
 
 def validate_happy_data(df):
     """Validate hap.py CSV has required columns and data"""
-    required_columns = ['Type', 'Subtype', 'Subset', 'METRIC.Recall', 'METRIC.Precision', 'METRIC.F1_Score']
+    required_columns = {'Type', 'Subtype', 'Subset', 'METRIC.Recall', 'METRIC.Precision', 'METRIC.F1_Score'}
     
-    missing_columns = [col for col in required_columns if col not in df.columns]
+    missing_columns = sorted(required_columns.difference(df.columns))
     if missing_columns:
         logger.error(f"Missing required columns: {missing_columns}")
         return False
@@ -59,6 +114,137 @@ def validate_happy_data(df):
 # MAIN PARSING FUNCTION
 # ============================================================================
 
+def build_happy_records(happy_file_name, experiment_id):
+    """
+    Read a hap.py CSV output file and build its result rows (no database access).
+    
+    Validates the file, keeps rows with Subtype='*' and Filter='ALL' and converts
+    hap.py regions to database enums.
+    
+    Args:
+        happy_file_name (str): Filename of hap.py CSV (e.g., '001_HG002_Illumina_DeepVariant.csv')
+        experiment_id (int): Database ID of the experiment these results belong to
+        
+    Returns:
+        dict: Result with keys:
+            - success (bool)
+            - error (str, on failure)
+            - benchmark_records (list): BenchmarkResult insert rows
+            - overall_records (list): OverallResult insert rows ('All Regions' only)
+            - skipped_regions (list): Region names with no matching enum (one per row)
+    """
+    happy_file_path = get_data_file_path(happy_file_name)
+    
+    logger.debug(f"Parsing hap.py file: {happy_file_name} for experiment {experiment_id}")
+    
+    # File validation
+    if not validate_happy_file(happy_file_path):
+        return {"success": False, "error": f"File validation failed for {happy_file_path}"}
+    
+    # Read CSV file
+    try:
+        # Callable usecols: optional het/homalt columns may be absent
+        df = pd.read_csv(happy_file_path, usecols=lambda col: col in HAPPY_COLS, dtype=HAPPY_DTYPES)
+        logger.debug(f"Read {len(df)} rows from {happy_file_name}")
+    except Exception as e:
+        logger.error(f"Failed to read CSV file {happy_file_path}: {e}")
+        return {"success": False, "error": f"Failed to read CSV: {e}"}
+    
+    # Data validation
+    if not validate_happy_data(df):
+        return {"success": False, "error": "Invalid hap.py data format"}
+
+    # Filter for specific rows (Subtype='*', Filter='ALL')
+    # Single expression (numexpr-evaluated when installed, python engine otherwise)
+    filtered_df = df.query("Subtype == '*' and Filter == 'ALL'")
+   
+    if len(filtered_df) == 0:
+        logger.warning(f"No matching rows found in {happy_file_path}")
+        return {"success": False, "error": "No matching rows found (Subtype='*', Filter='ALL')"}
+   
+    logger.debug(f"Found {len(filtered_df)} filtered rows for processing")
+   
+    benchmark_records = []
+    overall_records = []
+    skipped_regions = []
+
+    # Convert metric columns once per column (absent columns stay None)
+    metrics_df = pd.DataFrame(index=filtered_df.index)
+    for field, column in FLOAT_FIELDS.items():
+        metrics_df[field] = safe_float_series(filtered_df[column]) if column in filtered_df else None
+    for field, column in INT_FIELDS.items():
+        metrics_df[field] = safe_int_series(filtered_df[column]) if column in filtered_df else None
+    metrics_rows = metrics_df.astype(object).where(metrics_df.notna(), None).to_dict('records')
+
+    # Convert hap.py region strings to enums (once per distinct region)
+    region_lookup = {subset: RegionType.from_string(subset) for subset in filtered_df['Subset'].unique()}
+    region_enums = [region_lookup[subset] for subset in filtered_df['Subset']]
+
+    # Build plain insert rows (no ORM objects)
+    for variant_type, subtype, subset, filter_type, region_enum, metrics in zip(
+        filtered_df['Type'], filtered_df['Subtype'], filtered_df['Subset'],
+        filtered_df['Filter'], region_enums, metrics_rows
+    ):
+        if region_enum is None:
+            skipped_regions.append(subset)
+            continue
+        
+        # BenchmarkResult for all regions
+        benchmark_records.append({
+            'experiment_id': experiment_id,
+            'variant_type': variant_type,
+            'subtype': subtype.replace('*', 'ALL_SUBTYPES'),
+            'subset': region_enum,
+            'filter_type': filter_type,
+            **metrics
+        })
+
+        # Store in overall table (ALL subset only for quick access)
+        if region_enum == RegionType.ALL:
+            overall_record = {'experiment_id': experiment_id, 'variant_type': variant_type}
+            overall_record.update({field: metrics[field] for field in OVERALL_FIELDS})
+            overall_records.append(overall_record)
+
+    return {
+        "success": True,
+        "benchmark_records": benchmark_records,
+        "overall_records": overall_records,
+        "skipped_regions": skipped_regions
+    }
+
+def insert_happy_records(session, benchmark_records, overall_records):
+    """Store result rows from build_happy_records (one executemany INSERT per table)."""
+    if benchmark_records:
+        session.execute(insert(BenchmarkResult), benchmark_records)
+    if overall_records:
+        session.execute(insert(OverallResult), overall_records)
+
+def summarize_happy_records(experiment_id, records):
+    """Log and return the success result for rows built by build_happy_records."""
+    skipped_regions = records["skipped_regions"]
+    results_added = len(records["benchmark_records"])
+    overall_results_added = len(records["overall_records"])
+
+    # Log summary
+    if skipped_regions:
+        unique_skipped = list(set(skipped_regions))
+        logger.warning(f"Skipped {len(skipped_regions)} rows with unknown regions: {unique_skipped}")
+    
+    success_message = f"Added {results_added} results and {overall_results_added} overall results"
+    if skipped_regions:
+        success_message += f" ({len(skipped_regions)} rows skipped)"
+    
+    logger.info(f"Experiment {experiment_id}: {success_message}")
+    
+    return {
+        "success": True, 
+        "message": success_message,
+        "results_added": results_added,
+        "overall_added": overall_results_added,
+        "regions_skipped": len(skipped_regions),
+        "skipped_regions": list(set(skipped_regions))
+    }
+
 def parse_happy_csv(happy_file_name, experiment_id, session):
     """
     Parse hap.py CSV output file and store performance metrics in database.
@@ -87,10 +273,6 @@ def parse_happy_csv(happy_file_name, experiment_id, session):
             - skipped_regions (list, optional): Names of unknown regions
     """
     
-    happy_file_path = get_data_file_path(happy_file_name)
-    
-    logger.debug(f"Parsing hap.py file: {happy_file_name} for experiment {experiment_id}")
-    
     try:
         # Check for existing results
         existing_benchmark = session.query(BenchmarkResult).filter_by(experiment_id=experiment_id).first()
@@ -100,141 +282,14 @@ def parse_happy_csv(happy_file_name, experiment_id, session):
             logger.info(f"Results already exist for experiment {experiment_id}")
             return {"success": True, "message": f"Results already exist for experiment {experiment_id}", "skipped": True}
         
-        # File validation
-        if not validate_happy_file(happy_file_path):
-            return {"success": False, "error": f"File validation failed for {happy_file_path}"}
-        
-        # Read CSV file
-        try:
-            df = pd.read_csv(happy_file_path)
-            logger.debug(f"Read {len(df)} rows from {happy_file_name}")
-        except Exception as e:
-            logger.error(f"Failed to read CSV file {happy_file_path}: {e}")
-            return {"success": False, "error": f"Failed to read CSV: {e}"}
-        
-        # Data validation
-        if not validate_happy_data(df):
-            return {"success": False, "error": "Invalid hap.py data format"}
-
-        # Filter for specific rows (Subtype='*', Filter='ALL')
-        filtered_df = df[(df['Subtype'] == '*') & (df['Filter'] == 'ALL')]
-   
-        if len(filtered_df) == 0:
-            logger.warning(f"No matching rows found in {happy_file_path}")
-            return {"success": False, "error": "No matching rows found (Subtype='*', Filter='ALL')"}
-       
-        logger.debug(f"Found {len(filtered_df)} filtered rows for processing")
-       
-        results_added = 0
-        overall_results_added = 0
-        skipped_regions = []
-
-        # Process each row and create database records
-        for _, row in filtered_df.iterrows():
-            # Convert hap.py region string to enum
-            region_enum = RegionType.from_string(row['Subset'])
-            if region_enum is None:
-                skipped_regions.append(row['Subset'])
-                continue
-           
-            # Create BenchmarkResult for all regions
-            result = BenchmarkResult(
-                experiment_id=experiment_id,
-                
-                # Main identifiers
-                variant_type=row['Type'],
-                subtype=row['Subtype'].replace('*', 'ALL_SUBTYPES'),
-                subset=region_enum,
-                filter_type=row['Filter'],
-                
-                # Performance metrics
-                metric_recall=safe_float(row.get('METRIC.Recall')),
-                metric_precision=safe_float(row.get('METRIC.Precision')),
-                metric_f1_score=safe_float(row.get('METRIC.F1_Score')),
-                
-                # Subset information
-                subset_size=safe_float(row.get('Subset.Size')),
-                subset_is_conf_size=safe_float(row.get('Subset.IS_CONF.Size')),
-                
-                # Truth set totals
-                truth_total=safe_int(row.get('TRUTH.TOTAL')),
-                truth_total_het=safe_int(row.get('TRUTH.TOTAL.het')),
-                truth_total_homalt=safe_int(row.get('TRUTH.TOTAL.homalt')),
-                
-                # Truth set true positives
-                truth_tp=safe_int(row.get('TRUTH.TP')),
-                truth_tp_het=safe_int(row.get('TRUTH.TP.het')),
-                truth_tp_homalt=safe_int(row.get('TRUTH.TP.homalt')),
-                
-                # Truth set false negatives
-                truth_fn=safe_int(row.get('TRUTH.FN')),
-                truth_fn_het=safe_int(row.get('TRUTH.FN.het')),
-                truth_fn_homalt=safe_int(row.get('TRUTH.FN.homalt')),
-                
-                # Query totals
-                query_total=safe_int(row.get('QUERY.TOTAL')),
-                query_total_het=safe_int(row.get('QUERY.TOTAL.het')),
-                query_total_homalt=safe_int(row.get('QUERY.TOTAL.homalt')),
-                
-                # Query true positives
-                query_tp=safe_int(row.get('QUERY.TP')),
-                query_tp_het=safe_int(row.get('QUERY.TP.het')),
-                query_tp_homalt=safe_int(row.get('QUERY.TP.homalt')),
-                
-                # Query false positives
-                query_fp=safe_int(row.get('QUERY.FP')),
-                query_fp_het=safe_int(row.get('QUERY.FP.het')),
-                query_fp_homalt=safe_int(row.get('QUERY.FP.homalt')),
-                
-                # Query unknown
-                query_unk=safe_int(row.get('QUERY.UNK')),
-                query_unk_het=safe_int(row.get('QUERY.UNK.het')),
-                query_unk_homalt=safe_int(row.get('QUERY.UNK.homalt'))
-            )
-           
-            session.add(result)
-            results_added += 1
-
-            # Store in overall table (ALL subset only for quick access)
-            if region_enum == RegionType.ALL:
-                overall_result = OverallResult(
-                    experiment_id=experiment_id,
-                    variant_type=row['Type'],
-                    metric_recall=safe_float(row.get('METRIC.Recall')),
-                    metric_precision=safe_float(row.get('METRIC.Precision')),
-                    metric_f1_score=safe_float(row.get('METRIC.F1_Score')),
-                    truth_total=safe_int(row.get('TRUTH.TOTAL')),
-                    truth_tp=safe_int(row.get('TRUTH.TP')),
-                    truth_fn=safe_int(row.get('TRUTH.FN')),
-                    query_total=safe_int(row.get('QUERY.TOTAL')),
-                    query_tp=safe_int(row.get('QUERY.TP')),
-                    query_fp=safe_int(row.get('QUERY.FP'))
-                )
-               
-                session.add(overall_result)
-                overall_results_added += 1
-
-        # Log summary
-        if skipped_regions:
-            unique_skipped = list(set(skipped_regions))
-            logger.warning(f"Skipped {len(skipped_regions)} rows with unknown regions: {unique_skipped}")
-        
-        success_message = f"Added {results_added} results and {overall_results_added} overall results"
-        if skipped_regions:
-            success_message += f" ({len(skipped_regions)} rows skipped)"
-        
-        logger.info(f"Experiment {experiment_id}: {success_message}")
+        records = build_happy_records(happy_file_name, experiment_id)
+        if not records["success"]:
+            return records
         
-        return {
-            "success": True, 
-            "message": success_message,
-            "results_added": results_added,
-            "overall_added": overall_results_added,
-            "regions_skipped": len(skipped_regions),
-            "skipped_regions": list(set(skipped_regions))
-        }
+        insert_happy_records(session, records["benchmark_records"], records["overall_records"])
+        return summarize_happy_records(experiment_id, records)
        
     except Exception as e:
-        error_message = f"Error parsing {happy_file_path}: {e}"
+        error_message = f"Error parsing {get_data_file_path(happy_file_name)}: {e}"
         logger.error(error_message)
-        return {"success": False, "error": str(e)}
\ No newline at end of file
+        return {"success": False, "error": str(e)}
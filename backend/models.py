@@ -11,13 +11,23 @@ Main components:
 - RegionType enum with hap.py mapping methods
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Enum, func
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Enum, Index, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 import enum
 
 Base = declarative_base()
 
+def db_now():
+    """
+    Database-side timestamp: local time with milliseconds (SQLite CURRENT_TIMESTAMP is UTC, whole seconds).
+    
+    Stored as 'YYYY-MM-DD HH:MM:SS.mmm' text: millisecond precision, the finest
+    SQLite's clock gives (Python datetime.now() values carried microseconds).
+    The DateTime columns read it back as a datetime with microsecond = ms * 1000.
+    """
+    return func.strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')
+
 # ============================================================================
 # ENUM DEFINITIONS - All uppercase
 # ============================================================================
@@ -346,8 +356,9 @@ class User(Base):
     email = Column(String(255), unique=True, nullable=False)     # From OIDC
     full_name = Column(String(255))                               # From OIDC
     is_admin = Column(Boolean, default=False)                     # From OIDC group
-    created_at = Column(DateTime, default=func.now())
-    last_login = Column(DateTime)
+    created_at = Column(DateTime, default=db_now())
+    last_login = Column(DateTime, default=db_now())
+    experiment_count = Column(Integer, default=0, server_default='0', nullable=False)  # Maintained by DB triggers (database.py)
     
     # Relationships
     experiments = relationship("Experiment", back_populates="owner")
@@ -484,6 +495,10 @@ class Experiment(Base):
     Main table linking all metadata and details related to a benchmarking experiment.
     """
     __tablename__ = 'experiments'
+    __table_args__ = (
+        # Per-user listings/counts filter on owner and sort by creation date
+        Index('ix_experiment_owner_created', 'owner_id', 'created_at'),
+    )
     
     id = Column(Integer, primary_key=True)
     name = Column(String(200), nullable=False)
@@ -515,11 +530,43 @@ class Experiment(Base):
     variant = relationship("Variant", back_populates="experiments")
     quality_control = relationship("QualityControl", back_populates="experiments")
     chemistry = relationship("Chemistry", back_populates="experiments")
-    benchmark_results = relationship("BenchmarkResult", back_populates="experiment")
+    benchmark_results = relationship("BenchmarkResult", back_populates="experiment", passive_deletes=True)
     
     def __repr__(self):
         return f"<Experiment(name={self.name})>"
 
+class ExperimentFlat(Base):
+    """
+    Denormalized copy of experiment + lookup table display values for the overview table.
+    Rebuilt by experiment_flat.refresh_experiment_flat() whenever experiments are written.
+    """
+    __tablename__ = 'experiment_flat'
+    __table_args__ = (
+        # Overview filters on technology / caller
+        Index('ix_experiment_flat_tech_caller', 'technology', 'caller'),
+    )
+
+    id = Column(Integer, ForeignKey('experiments.id', ondelete='CASCADE'), primary_key=True)
+    name = Column(String(200), nullable=False)
+
+    # Enum display values (e.g. "10X"), not enum names
+    technology = Column(String(50))
+    platform_name = Column(String(50))
+    caller = Column(String(50))
+    caller_version = Column(String(50))
+    chemistry = Column(String(50))
+    truth_set = Column(String(50))
+    sample = Column(String(50))
+
+    # Visibility
+    is_public = Column(Boolean)
+    owner_id = Column(Integer)
+
+    created_at = Column(DateTime)
+
+    def __repr__(self):
+        return f"<ExperimentFlat(id={self.id}, name={self.name})>"
+
 # ============================================================================
 # BENCHMARKING RESULTS TABLES
 # ============================================================================
@@ -530,9 +577,13 @@ class OverallResult(Base):
     Used for main performane results (Tab 2 and 3) 
     """
     __tablename__ = 'overall_results'
+    __table_args__ = (
+        # Performance queries select by experiment (and variant type)
+        Index('ix_overall_exp_vtype', 'experiment_id', 'variant_type'),
+    )
     
     id = Column(Integer, primary_key=True)
-    experiment_id = Column(Integer, ForeignKey('experiments.id'), nullable=False)
+    experiment_id = Column(Integer, ForeignKey('experiments.id', ondelete='CASCADE'), nullable=False)
     
     # Core identifiers
     variant_type = Column(String(20), nullable=False)      # SNP, INDEL
@@ -562,9 +613,13 @@ class BenchmarkResult(Base):
     Used for stratified analysis (Tab 4 only)
     """
     __tablename__ = 'benchmark_results'
+    __table_args__ = (
+        # Stratified queries filter experiment_id IN, variant_type IN, subset IN
+        Index('ix_br_exp_vtype_subset', 'experiment_id', 'variant_type', 'subset'),
+    )
     
     id = Column(Integer, primary_key=True)
-    experiment_id = Column(Integer, ForeignKey('experiments.id'), nullable=False)
+    experiment_id = Column(Integer, ForeignKey('experiments.id', ondelete='CASCADE'), nullable=False)
 
     # Core identifiers (filtering criteria)
     variant_type = Column(String(20), nullable=False)      # SNP, INDEL
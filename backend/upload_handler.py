@@ -29,6 +29,7 @@ from config import DATA_FOLDER
 from direct_db_population import create_experiment_direct
 from database import get_db_session
 from models import Experiment
+import cache
 from sqlalchemy import func
 
 logger = logging.getLogger(__name__)
@@ -44,7 +45,7 @@ REQUIRED_METADATA = [
 ]
 
 # Required columns in hap.py CSV
-REQUIRED_COLS = ['Type', 'Subtype', 'Subset', 'METRIC.Recall', 'METRIC.Precision', 'METRIC.F1_Score']
+REQUIRED_COLS = {'Type', 'Subtype', 'Subset', 'METRIC.Recall', 'METRIC.Precision', 'METRIC.F1_Score'}
 
 # import enum mappings for validation
 from enum_mappings import VALID_TECHNOLOGIES, VALID_CALLERS 
@@ -67,10 +68,11 @@ def validate_happy_file(file_path):
             logger.error(f"File not found: {file_path}")
             return False, "File not found"
             
-        df = pd.read_csv(file_path)
+        # Only the required columns are needed for validation
+        df = pd.read_csv(file_path, usecols=lambda col: col in REQUIRED_COLS)
         
         # Check required columns
-        missing = [col for col in REQUIRED_COLS if col not in df.columns]
+        missing = sorted(REQUIRED_COLS.difference(df.columns))
         if missing:
             return False, f"Missing columns: {', '.join(missing)}"
         
@@ -361,6 +363,10 @@ def process_upload_direct(temp_file_path, metadata_json_string):
                     "filename": None
                 }
         
+        # Results are committed - drop anything cached while they were still missing
+        cache.invalidate_prefix("overview:")
+        cache.invalidate_prefix(f"experiment:performance:{experiment_id}:")
+        
         # STEP 10: Add to CSV backup
         try:
             from csv_backup import add_to_backup
@@ -383,9 +389,7 @@ def process_upload_direct(temp_file_path, metadata_json_string):
         
     except Exception as e:
         error_msg = f"Upload failed: {str(e)}"
-        logger.error(error_msg)
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception("Upload failed")
         
         # Rollback if experiment was created before failure
         if experiment_id:
@@ -411,7 +415,8 @@ def _rollback_experiment(experiment_id, file_path=None, session=None):
     Args:
         experiment_id: ID of experiment to rollback
         file_path: Path to saved file (will be deleted)
-        session: SQLAlchemy session (if None, creates own session)
+        session: SQLAlchemy session (if None, creates own session and commits;
+            otherwise the caller commits and drops the "overview:"/"experiment:" cache)
     """
     from database import Session
     from models import Experiment, BenchmarkResult, OverallResult
@@ -429,6 +434,11 @@ def _rollback_experiment(experiment_id, file_path=None, session=None):
         if owns_session:
             session.commit()
             
+            # Same as delete_handler: cached overviews, id lists and
+            # per-experiment lookups may still hold the removed experiment
+            cache.invalidate_prefix("overview:")
+            cache.invalidate_prefix("experiment:")
+            
         logger.info(f"Rolled back experiment {experiment_id} from database")
     except Exception as e:
         logger.error(f"Failed to rollback experiment {experiment_id}: {e}")
@@ -6,17 +6,39 @@ User management for SNV Benchmarking Dashboard.
 
 Main components:
 - User creation/retrieval on OIDC login
-- User lookup by ID or username
+- User lookup by ID or username (TTL-cached, see cache.py)
 - Admin status management
 """
 
-from datetime import datetime
+from sqlalchemy import update, select, bindparam, func
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.exc import IntegrityError
 from database import get_db_session
-from models import User
+from models import User, db_now
+import cache
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# SQLite strftime format: ISO 8601 with milliseconds (the precision db_now() stores)
+ISO_FORMAT = '%Y-%m-%dT%H:%M:%f'
+
+# Columns of the user info dict, shared by every lookup so all of them return
+# identical strings; timestamps are formatted by SQLite (NULL stays NULL)
+_USER_INFO_COLUMNS = (
+    User.id.label('user_id'),
+    User.username,
+    User.email,
+    User.full_name,
+    User.is_admin,
+    func.strftime(ISO_FORMAT, User.created_at).label('created_at'),
+    func.strftime(ISO_FORMAT, User.last_login).label('last_login')
+)
+
+# Pre-built lookup statement; compiled SQL is reused from the engine cache
+_USER_BY_NAME = select(User).where(User.username == bindparam("username"))
+
 # ============================================================================
 # USER SYNC ON LOGIN
 # ============================================================================
@@ -37,47 +59,62 @@ def get_or_create_user(username, email, full_name, is_admin):
     """
     try:
         with get_db_session() as session:
-            # Try to find existing user by username first, then by email
-            user = session.query(User).filter_by(username=username).first()
-            
-            if not user and email:
-                user = session.query(User).filter_by(email=email).first()
-                if user:
-                    # Update username if found by email (migration case)
-                    user.username = username
-                    logger.info(f"Updated username for existing user: {email} -> {username}")
+            # Single upsert keyed on username: inserts new users, refreshes existing ones.
+            # created_at/last_login come from the database clock (column defaults).
+            stmt = insert(User).values(
+                username=username,
+                email=email,
+                full_name=full_name,
+                is_admin=is_admin
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[User.username],
+                set_={
+                    'last_login': db_now(),
+                    'is_admin': stmt.excluded.is_admin,
+                    'email': stmt.excluded.email,
+                    'full_name': stmt.excluded.full_name
+                }
+            ).returning(User.id, User.username, User.is_admin, User.created_at, User.last_login)
             
-            if user:
-                # Update existing user on each login
-                user.last_login = datetime.now()
-                user.is_admin = is_admin
-                user.email = email
-                user.full_name = full_name
+            try:
+                with session.begin_nested():
+                    user = session.execute(stmt).one()
+                # Both timestamps come from the same statement only on insert
+                is_new = user.created_at == user.last_login
+            except IntegrityError:
+                if not email:
+                    raise
+                # Email already registered under another username (migration case)
+                user = session.execute(
+                    update(User)
+                    .where(User.email == email)
+                    .values(username=username, last_login=db_now(), is_admin=is_admin, full_name=full_name)
+                    .returning(User.id, User.username, User.is_admin, User.created_at, User.last_login)
+                ).one()
                 is_new = False
-                logger.info(f"User login: {username} (ID: {user.id}, admin: {is_admin})")
-            else:
-                # Create new user
-                user = User(
-                    username=username,
-                    email=email,
-                    full_name=full_name,
-                    is_admin=is_admin,
-                    created_at=datetime.now(),
-                    last_login=datetime.now()
-                )
-                session.add(user)
-                is_new = True
-                logger.info(f"New user created: {username} (admin: {is_admin})")
+                logger.info(f"Updated username for existing user: {email} -> {username}")
+                # Old username is unknown here; drop all cached name lookups
+                cache.invalidate_prefix("user:name:")
             
-            session.flush()  # Ensure ID is generated
+            if is_new:
+                logger.info(f"New user created: {username} (admin: {is_admin})")
+            else:
+                logger.info(f"User login: {username} (ID: {user.id}, admin: {is_admin})")
             
-            return {
+            result = {
                 "user_id": user.id,
                 "username": user.username,
                 "is_admin": user.is_admin,
                 "is_new": is_new,
                 "success": True
             }
+        
+        # Login refreshed last_login/is_admin - drop cached lookups after commit
+        cache.invalidate(f"user:id:{result['user_id']}", f"user:name:{username}")
+        # The overview shows the owner's email, which login may have changed
+        cache.invalidate_prefix("overview:")
+        return result
             
     except Exception as e:
         logger.error(f"Error in get_or_create_user: {e}")
@@ -94,6 +131,10 @@ def get_or_create_user(username, email, full_name, is_admin):
 # USER LOOKUP FUNCTIONS
 # ============================================================================
 
+def _user_info(row):
+    """Build the user dict from a _USER_INFO_COLUMNS row."""
+    return dict(row._mapping)
+
 def get_user_by_id(user_id):
     """
     Get user by database ID.
@@ -106,21 +147,22 @@ def get_user_by_id(user_id):
     """
     if not user_id:
         return None
+    
+    cache_key = f"user:id:{user_id}"
+    cached = cache.get_cached(cache_key)
+    if cached is not None:
+        return cached
         
     try:
         with get_db_session() as session:
-            user = session.query(User).filter_by(id=user_id).first()
+            user = session.execute(
+                select(*_USER_INFO_COLUMNS).where(User.id == user_id)
+            ).first()
             
             if user:
-                return {
-                    "user_id": user.id,
-                    "username": user.username,
-                    "email": user.email,
-                    "full_name": user.full_name,
-                    "is_admin": user.is_admin,
-                    "created_at": user.created_at.isoformat() if user.created_at else None,
-                    "last_login": user.last_login.isoformat() if user.last_login else None
-                }
+                user_info = _user_info(user)
+                cache.set_cached(cache_key, user_info)
+                return user_info
             return None
             
     except Exception as e:
@@ -139,29 +181,91 @@ def get_user_by_username(username):
     """
     if not username:
         return None
+    
+    cache_key = f"user:name:{username}"
+    cached = cache.get_cached(cache_key)
+    if cached is not None:
+        return cached
         
     try:
         with get_db_session() as session:
-            user = session.query(User).filter_by(username=username).first()
+            user = session.execute(_USER_BY_NAME, {"username": username}).scalar_one_or_none()
             
             if user:
-                return {
+                user_info = {
                     "user_id": user.id,
                     "username": user.username,
                     "email": user.email,
                     "full_name": user.full_name,
                     "is_admin": user.is_admin
                 }
+                cache.set_cached(cache_key, user_info)
+                return user_info
             return None
             
     except Exception as e:
         logger.error(f"Error getting user by username {username}: {e}")
         return None
 
+def get_users_by_ids(user_ids):
+    """
+    Get several users by database ID in one query.
+    
+    Cached users are served from the cache; the rest are fetched with a
+    single IN (...) query and cached. Use instead of calling
+    get_user_by_id once per row.
+    
+    Args:
+        user_ids: Iterable of user database IDs (None/duplicates ignored)
+        
+    Returns:
+        dict: {user_id: user info dict} for the users that exist
+    """
+    users = {}
+    missing = []
+    for user_id in {uid for uid in user_ids if uid}:
+        cached = cache.get_cached(f"user:id:{user_id}")
+        if cached is not None:
+            users[user_id] = cached
+        else:
+            missing.append(user_id)
+    
+    if not missing:
+        return users
+        
+    try:
+        with get_db_session() as session:
+            for user in session.execute(select(*_USER_INFO_COLUMNS).where(User.id.in_(missing))):
+                user_info = _user_info(user)
+                cache.set_cached(f"user:id:{user.user_id}", user_info)
+                users[user.user_id] = user_info
+        return users
+            
+    except Exception as e:
+        logger.error(f"Error getting users by IDs {missing}: {e}")
+        return users
+
 # ============================================================================
 # USER STATISTICS (for admin panel later)
 # ============================================================================
 
+def iter_all_users():
+    """
+    Stream all users (admin function), newest first.
+    
+    Rows are fetched in chunks of 200 and yielded one dict at a time,
+    so the full user list is never held in memory.
+    
+    Yields:
+        dict: User info
+    """
+    with get_db_session() as session:
+        # Column tuples only - no User instances or identity map entries
+        rows = session.query(*_USER_INFO_COLUMNS).order_by(User.created_at.desc()).yield_per(200)
+        
+        for u in rows:
+            yield _user_info(u)
+
 def get_all_users():
     """
     Get all users (admin function).
@@ -170,23 +274,30 @@ def get_all_users():
         list: List of user dicts
     """
     try:
-        with get_db_session() as session:
-            users = session.query(User).order_by(User.created_at.desc()).all()
-            
-            return [{
-                "user_id": u.id,
-                "username": u.username,
-                "email": u.email,
-                "full_name": u.full_name,
-                "is_admin": u.is_admin,
-                "created_at": u.created_at.isoformat() if u.created_at else None,
-                "last_login": u.last_login.isoformat() if u.last_login else None
-            } for u in users]
+        return list(iter_all_users())
             
     except Exception as e:
         logger.error(f"Error getting all users: {e}")
         return []
 
+def get_all_users_json():
+    """
+    Get all users as a JSON array string (admin function).
+    
+    Serialized once on the Python side so reticulate hands R a single
+    string (parse with jsonlite::fromJSON) instead of converting a list
+    of dicts element by element.
+    
+    Returns:
+        str: JSON array of user dicts ("[]" on error)
+    """
+    try:
+        return json.dumps(list(iter_all_users()))
+            
+    except Exception as e:
+        logger.error(f"Error getting all users as JSON: {e}")
+        return "[]"
+
 def get_user_experiment_count(user_id):
     """
     Get count of experiments owned by user.
@@ -197,15 +308,16 @@ def get_user_experiment_count(user_id):
     Returns:
         int: Number of experiments
     """
-    from models import Experiment
-    
     if not user_id:
         return 0
         
     try:
         with get_db_session() as session:
-            count = session.query(Experiment).filter_by(owner_id=user_id).count()
-            return count
+            # Counter column kept current by triggers on experiments
+            count = session.execute(
+                select(User.experiment_count).where(User.id == user_id)
+            ).scalar()
+            return count or 0
             
     except Exception as e:
         logger.error(f"Error getting experiment count for user {user_id}: {e}")
@@ -5,6 +5,7 @@
 Shared utility functions for data processing and conversion.
 """
 
+import numpy as np
 import pandas as pd
 
 def clean_value(value):
@@ -30,4 +31,23 @@ def safe_int(value):
     try:
         return int(float(value))
     except (ValueError, TypeError):
-        return None
\ No newline at end of file
+        return None
+
+# ============================================================================
+# SERIES VARIANTS (column-wise, same rules as the scalar versions above)
+# ============================================================================
+
+def clean_value_series(series):
+    """Column-wise clean_value: stripped lowercase strings, None for missing"""
+    cleaned = series.astype('string').str.strip().str.lower()
+    return cleaned.astype(object).where(series.notna(), None)
+
+def safe_float_series(series):
+    """Column-wise safe_float: float64 Series, NaN for missing/unparseable"""
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype('float64')
+    return pd.to_numeric(series.astype(str).str.replace(',', '', regex=False), errors='coerce')
+
+def safe_int_series(series):
+    """Column-wise safe_int: truncated nullable Int64 Series, <NA> for missing/unparseable"""
+    return np.trunc(pd.to_numeric(series, errors='coerce')).astype('Int64')